@@ -0,0 +1,8 @@
+"""AIBrain Object Tracking
+
+Core library of the AIBTrk project. It provides the shared data objects,
+container primitives, and computer-vision I/O utilities used by the
+tracking pipelines.
+"""
+
+__version__ = "0.1.0"
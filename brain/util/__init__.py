@@ -0,0 +1,5 @@
+"""Utility Subpackage
+
+Shared helpers of the AIBTrk library: base objects, containers,
+data-type predicates, and computer-vision utilities.
+"""
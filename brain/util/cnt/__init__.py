@@ -0,0 +1,4 @@
+"""Container Subpackage"""
+
+from brain.util.cnt.b_dict import BaseDict
+from brain.util.cnt.b_list import BaseList
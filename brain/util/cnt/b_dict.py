@@ -0,0 +1,341 @@
+"""Base Dict Module
+
+This module defines :class:`BaseDict`, a lightweight, optionally
+size-bounded dictionary container used for keyed caches (e.g. per-track
+state) across the library.
+"""
+
+import functools
+import os
+import pprint
+import sys
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Callable, Dict, Final, Generic, List, Optional, Tuple, TypeVar, Union
+
+T_key = TypeVar("T_key")
+T_value = TypeVar("T_value")
+
+# Normalized names, interned and keyed by the raw name. See
+# :mod:`brain.util.cnt.b_list` for the rationale.
+_NAME_CACHE: Final[Dict[str, str]] = {}
+
+# Opt-in instance pooling; see :mod:`brain.util.cnt.b_list` for the
+# rationale and the caveats behind the environment flag.
+_POOLING_ENABLED: Final[bool] = os.environ.get("AIB_CNT_POOL", "0") == "1"
+_POOL_CAP: Final[int] = 256
+
+
+class BaseDict(OrderedDict, Generic[T_key, T_value]):
+    """Base Dict
+
+    A lightweight dictionary container. When `a_max_size` is set, the
+    dictionary keeps at most that many entries and evicts according to the
+    removal strategy (`first`, `last`, or `lru`) chosen at construction
+    time. With `lru`, every access refreshes the entry and eviction drops
+    the least recently used one.
+
+    The class subclasses :class:`collections.OrderedDict` directly, so
+    lookups, containment checks, iteration, length, and deletion all run
+    the builtin C implementations with no Python-level wrapper; only the
+    assignment path (eviction) and the LRU read path carry an override.
+
+    Attributes:
+        name (str): The normalized name of the dictionary.
+    """
+
+    # No __slots__: the OrderedDict base type always carries an instance
+    # __dict__, so a slots declaration here would neither drop it nor
+    # restrict attributes. Only BaseList keeps the slotted layout.
+
+    # Pretty-printing is too slow for log interpolation; see
+    # :class:`brain.util.cnt.b_list.BaseList`.
+    _pretty: bool = False
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "BaseDict[T_key, T_value]":
+        """Create a dictionary instance, reusing a pooled one when enabled.
+
+        Returns:
+            BaseDict[T_key, T_value]: The created (or recycled) instance.
+        """
+        if _POOLING_ENABLED:
+            # The pool is looked up on the exact class so subclasses never
+            # receive instances of a sibling type.
+            pool = cls.__dict__.get("_pool")
+            if pool:
+                return pool.pop()
+        return super().__new__(cls)
+
+    def release(self) -> None:
+        """Return the instance to its class pool for reuse.
+
+        The caller must not touch the instance afterwards; the next
+        construction of the same class may hand it back reinitialized.
+        A no-op unless pooling is enabled via `AIB_CNT_POOL=1`.
+        """
+        if not _POOLING_ENABLED:
+            return
+        cls = type(self)
+        pool = cls.__dict__.get("_pool")
+        if pool is None:
+            pool = []
+            cls._pool = pool
+        if len(pool) < _POOL_CAP:
+            self.clear()
+            pool.append(self)
+
+    def __init__(
+        self,
+        a_name: str = "BASE_DICT",
+        a_max_size: int = -1,
+        a_key: Optional[Union[T_key, List[T_key]]] = None,
+        a_value: Optional[Union[T_value, List[T_value]]] = None,
+        a_removal_strategy: str = "first",
+    ) -> None:
+        """Constructor of the base dictionary.
+
+        Args:
+            a_name (str, optional): The name of the dictionary.
+                Defaults to `BASE_DICT`.
+            a_max_size (int, optional): The maximum number of entries the
+                dictionary may hold, or -1 for an unbounded dictionary.
+                Defaults to -1.
+            a_key (Union[T_key, List[T_key]], optional): Initial key(s) to
+                populate the dictionary with. Defaults to None.
+            a_value (Union[T_value, List[T_value]], optional): Initial
+                value(s) matching `a_key`. Defaults to None.
+            a_removal_strategy (str, optional): The eviction strategy
+                (`first`, `last`, or `lru`) applied when the dictionary is
+                full. Defaults to `first`.
+
+        Raises:
+            ValueError: If the removal strategy is not supported, or if key
+                and value lists have different lengths.
+        """
+        super().__init__()
+        self.rename(a_name)
+        self._max_size: int = int(a_max_size)
+        # The strategy is resolved once here into a bound eviction callable,
+        # so the insertion hot path never re-parses the strategy string.
+        strategy: str = a_removal_strategy.lower()
+        if strategy != "first" and strategy != "last" and strategy != "lru":
+            raise ValueError(f"Invalid removal strategy `{a_removal_strategy}`.")
+        self._removal_strategy: str = strategy
+        # `lru` evicts from the front like `first`; the difference is that
+        # accesses refresh entries through the pre-bound `_on_access`
+        # hook, so the front is always the least recently used entry.
+        self._evict: Callable[[], Tuple[T_key, T_value]] = functools.partial(
+            self.popitem, last=strategy == "last"
+        )
+        self._on_access: Optional[Callable[[T_key], None]] = (
+            self.move_to_end if strategy == "lru" else None
+        )
+        if a_key is not None and a_value is not None:
+            if type(a_key) is list and type(a_value) is list and self._max_size == -1:
+                if len(a_key) != len(a_value):
+                    raise ValueError(
+                        f"`a_key` and `a_value` must have the same length, "
+                        f"but they are given as `{len(a_key)}` and `{len(a_value)}`."
+                    )
+                # One bulk insert instead of per-item appends that grow
+                # the backing dict through repeated resize steps.
+                self.update(zip(a_key, a_value))
+            else:
+                self.append(a_key, a_value)
+
+    def rename(self, a_name: str) -> None:
+        """Rename the dictionary, normalizing and interning the new name.
+
+        Args:
+            a_name (str): The name to be assigned.
+
+        Raises:
+            TypeError: If `a_name` is not a string.
+        """
+        if not isinstance(a_name, str):
+            raise TypeError(f"`a_name` must be a `str`, but it is given as `{type(a_name)}`.")
+        name = _NAME_CACHE.get(a_name)
+        if name is None:
+            name = sys.intern(a_name.upper().replace(" ", "_"))
+            _NAME_CACHE[a_name] = name
+        self.name = name
+
+    @property
+    def max_size(self) -> int:
+        """int: The maximum number of entries the dictionary may hold (-1 if unbounded)."""
+        return self._max_size
+
+    def to_dict(self) -> Dict[T_key, T_value]:
+        """Convert the dictionary into a plain dictionary representation.
+
+        Returns:
+            Dict[T_key, T_value]: A plain copy of the entries.
+        """
+        return dict(self)
+
+    def to_str(self) -> str:
+        """Convert the dictionary into a string representation.
+
+        The default is a plain `repr` of the entries; set the `_pretty`
+        class attribute to get the recursive pformat output.
+
+        Returns:
+            str: The string representation of the dictionary.
+        """
+        if self._pretty:
+            return pprint.pformat(self.to_dict())
+        return dict.__repr__(self)
+
+    def __repr__(self) -> str:
+        """Represent the dictionary as the plain repr of its entries.
+
+        Always takes the fast path regardless of `_pretty`, since reprs
+        are interpolated into logs and debugger views.
+
+        Returns:
+            str: The string representation of the dictionary.
+        """
+        return dict.__repr__(self)
+
+    def __getitem__(self, a_key: T_key) -> T_value:
+        """Get the value associated with the given key.
+
+        With the `lru` strategy the lookup refreshes the entry, keeping
+        the least recently used one at the front for eviction.
+
+        Args:
+            a_key (T_key): The key to look up.
+
+        Returns:
+            T_value: The value associated with the key.
+        """
+        value = dict.__getitem__(self, a_key)
+        if self._on_access is not None:
+            self._on_access(a_key)
+        return value
+
+    def __setitem__(self, a_key: T_key, a_value: T_value) -> None:
+        """Set the value associated with the given key.
+
+        Updates of existing keys are always in place; new keys go through
+        the bounded-append path when a maximum size is set. The membership
+        probe runs exactly once per assignment.
+
+        Args:
+            a_key (T_key): The key to be assigned.
+            a_value (T_value): The value to be assigned.
+        """
+        if self._max_size == -1 or dict.__contains__(self, a_key):
+            OrderedDict.__setitem__(self, a_key, a_value)
+            if self._on_access is not None:
+                self._on_access(a_key)
+        else:
+            self._append_item(a_key, a_value)
+
+    def append(
+        self,
+        a_key: Union[T_key, List[T_key]],
+        a_value: Union[T_value, List[T_value]],
+    ) -> None:
+        """Append entry(ies) to the dictionary.
+
+        Eviction on a full dictionary follows the removal strategy chosen
+        at construction time.
+
+        Args:
+            a_key (Union[T_key, List[T_key]]): The key(s) to be appended.
+            a_value (Union[T_value, List[T_value]]): The value(s) matching
+                `a_key`.
+
+        Raises:
+            ValueError: If key and value lists have different lengths.
+        """
+        if isinstance(a_key, list) and isinstance(a_value, list):
+            self.extend_pairs(a_key, a_value)
+        else:
+            self._append_item(a_key, a_value)
+
+    def extend_pairs(self, a_keys: List[T_key], a_values: List[T_value]) -> None:
+        """Append a batch of key/value pairs to the dictionary.
+
+        Args:
+            a_keys (List[T_key]): The keys to be appended.
+            a_values (List[T_value]): The values matching `a_keys`.
+
+        Raises:
+            ValueError: If key and value lists have different lengths.
+        """
+        if len(a_keys) != len(a_values):
+            raise ValueError(
+                f"`a_key` and `a_value` must have the same length, "
+                f"but they are given as `{len(a_keys)}` and `{len(a_values)}`."
+            )
+        if self._max_size == -1:
+            # A single bulk insert; no eviction can trigger on an
+            # unbounded dictionary.
+            self.update(zip(a_keys, a_values))
+        else:
+            append_item = self._append_item
+            for key, value in zip(a_keys, a_values):
+                append_item(key, value)
+
+    def _append_item(self, a_key: T_key, a_value: T_value) -> None:
+        """Append a single entry, evicting if the dictionary is full.
+
+        Appending an existing key updates it in place and never evicts,
+        since the insert does not grow the dictionary. The eviction
+        callable was resolved at construction time, so the
+        full-dictionary branch is a single bound call.
+
+        Args:
+            a_key (T_key): The key to be appended.
+            a_value (T_value): The value to be appended.
+        """
+        if (
+            self._max_size != -1
+            and dict.__len__(self) >= self._max_size
+            and not dict.__contains__(self, a_key)
+        ):
+            self._evict()
+        OrderedDict.__setitem__(self, a_key, a_value)
+
+    def copy(self, a_deep: bool = False) -> "BaseDict[T_key, T_value]":
+        """Create a structural copy of the dictionary.
+
+        The copy is shallow by default: the container is duplicated but
+        the values are shared. This skips `copy.deepcopy`'s memo dict and
+        `__reduce_ex__` dispatch, which is typically an order of magnitude
+        slower than the typed clone for flat containers. Pass
+        `a_deep=True` to also copy each value through its own `copy()`.
+
+        Args:
+            a_deep (bool, optional): Whether the values are copied as well.
+                Defaults to False.
+
+        Returns:
+            BaseDict[T_key, T_value]: The copied dictionary.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        OrderedDict.__init__(clone)
+        clone.name = self.name
+        clone._max_size = self._max_size
+        clone._removal_strategy = self._removal_strategy
+        clone._evict = functools.partial(
+            clone.popitem, last=self._removal_strategy == "last"
+        )
+        clone._on_access = (
+            clone.move_to_end if self._removal_strategy == "lru" else None
+        )
+        # Entries are written through OrderedDict.__setitem__ directly:
+        # the clone cannot overflow its own bound here, and reading the
+        # source through its items view keeps the LRU access hook from
+        # reordering the source mid-iteration.
+        if a_deep:
+            for key, value in self.items():
+                OrderedDict.__setitem__(
+                    clone, key, value.copy() if hasattr(value, "copy") else deepcopy(value)
+                )
+        else:
+            for key, value in self.items():
+                OrderedDict.__setitem__(clone, key, value)
+        return clone
@@ -0,0 +1,384 @@
+"""Base List Module
+
+This module defines :class:`BaseList`, a lightweight, optionally
+size-bounded list container used for streaming buffers (e.g. frame
+caches) across the library.
+"""
+
+import os
+import pprint
+import sys
+from collections import deque
+from copy import deepcopy
+from typing import Any, Callable, Dict, Final, Generic, List, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+# Normalized names, interned and keyed by the raw name. Containers are
+# created with a handful of distinct names, so the normalization runs
+# once per raw name and every instance shares the same string object.
+_NAME_CACHE: Final[Dict[str, str]] = {}
+
+# Opt-in instance pooling for "create, fill, consume, drop" churn. Reuse
+# through a freelist skips the allocator and reduces GC pressure, but
+# keeping released instances alive has subtle lifetime implications, so
+# it stays behind an environment flag.
+_POOLING_ENABLED: Final[bool] = os.environ.get("AIB_CNT_POOL", "0") == "1"
+_POOL_CAP: Final[int] = 256
+
+
+class BaseList(Generic[T]):
+    """Base List
+
+    A lightweight list container. When `a_max_size` is set, the list keeps
+    at most that many items and evicts according to the removal strategy
+    (`first` or `last`) chosen at construction time.
+
+    Attributes:
+        name (str): The normalized name of the list.
+        items (List[T]): The underlying items of the list.
+    """
+
+    # Slots drop the per-instance `__dict__`, shrinking each container
+    # and turning attribute access into a fixed-offset load. The class
+    # pool stays a class attribute, which slots do not restrict.
+    __slots__ = ("name", "items", "_max_size", "_items", "_removal_strategy", "_evict")
+
+    # Pretty-printing walks and sorts the whole structure, which is far
+    # too slow for log interpolation; subclasses (or debugging sessions)
+    # can flip this to get the full pformat output from `to_str`.
+    _pretty: bool = False
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "BaseList[T]":
+        """Create a list instance, reusing a pooled one when enabled.
+
+        Returns:
+            BaseList[T]: The created (or recycled) instance.
+        """
+        if _POOLING_ENABLED:
+            # The pool is looked up on the exact class so subclasses never
+            # receive instances of a sibling type.
+            pool = cls.__dict__.get("_pool")
+            if pool:
+                return pool.pop()
+        return super().__new__(cls)
+
+    def release(self) -> None:
+        """Return the instance to its class pool for reuse.
+
+        The caller must not touch the instance afterwards; the next
+        construction of the same class may hand it back reinitialized.
+        A no-op unless pooling is enabled via `AIB_CNT_POOL=1`.
+        """
+        if not _POOLING_ENABLED:
+            return
+        cls = type(self)
+        pool = cls.__dict__.get("_pool")
+        if pool is None:
+            pool = []
+            cls._pool = pool
+        if len(pool) < _POOL_CAP:
+            self._items.clear()
+            pool.append(self)
+
+    def __init__(
+        self,
+        a_name: str = "BASE_LIST",
+        a_max_size: int = -1,
+        a_items: Optional[Union[T, List[T], "BaseList[T]"]] = None,
+        a_removal_strategy: str = "first",
+    ) -> None:
+        """Constructor of the base list.
+
+        Args:
+            a_name (str, optional): The name of the list. Defaults to `BASE_LIST`.
+            a_max_size (int, optional): The maximum number of items the list
+                may hold, or -1 for an unbounded list. Defaults to -1.
+            a_items (Union[T, List[T], BaseList[T]], optional): Initial
+                item(s) to populate the list with. Defaults to None.
+            a_removal_strategy (str, optional): The eviction strategy (`first`
+                or `last`) applied when the list is full. Defaults to `first`.
+
+        Raises:
+            ValueError: If the removal strategy is not supported.
+        """
+        self.rename(a_name)
+        self._max_size: int = int(a_max_size)
+        # A bounded list is a deque with `maxlen`, so evicting the oldest
+        # item on append moves a head pointer instead of shifting every
+        # element with an O(n) `pop(0)`.
+        self._items: Union[List[T], deque] = deque(maxlen=a_max_size) if a_max_size != -1 else []
+        # The strategy is resolved once here into a bound eviction callable,
+        # so the insertion hot path never re-parses the strategy string.
+        strategy: str = a_removal_strategy.lower()
+        if strategy != "first" and strategy != "last":
+            raise ValueError(f"Invalid removal strategy `{a_removal_strategy}`.")
+        self._removal_strategy: str = strategy
+        # With the `first` strategy the deque's `maxlen` self-evicts on
+        # append, so the insertion path carries no size check at all; only
+        # `last` needs an explicit pop of the newest item.
+        self._evict: Optional[Callable[[], T]] = (
+            self._items.pop if self._max_size != -1 and strategy == "last" else None
+        )
+        if a_items is not None:
+            if type(a_items) is list and self._max_size == -1:
+                # One presized O(n) copy instead of per-item appends that
+                # grow the backing list through repeated reallocations.
+                self._items = list(a_items)
+            else:
+                self.append(a_items)
+        # `name` and `items` are plain slotted attributes rather than
+        # properties, so frequent reads (logging, repr interpolation) are
+        # fixed-offset loads instead of Python-level getter calls.
+        # `items` aliases the backing container and is re-pointed at
+        # every site that rebinds `_items`.
+        self.items = self._items
+
+    def rename(self, a_name: str) -> None:
+        """Rename the list, normalizing and interning the new name.
+
+        Args:
+            a_name (str): The name to be assigned.
+
+        Raises:
+            TypeError: If `a_name` is not a string.
+        """
+        if not isinstance(a_name, str):
+            raise TypeError(f"`a_name` must be a `str`, but it is given as `{type(a_name)}`.")
+        name = _NAME_CACHE.get(a_name)
+        if name is None:
+            name = sys.intern(a_name.upper().replace(" ", "_"))
+            _NAME_CACHE[a_name] = name
+        self.name = name
+
+    @property
+    def max_size(self) -> int:
+        """int: The maximum number of items the list may hold (-1 if unbounded)."""
+        return self._max_size
+
+    def to_dict(self) -> List[Dict[str, Any]]:
+        """Convert the items of the list into dictionary representations.
+
+        The items are assumed homogeneous, so the `to_dict` method is
+        looked up once on the first item's class and reused across the
+        comprehension instead of paying an attribute lookup per item.
+
+        Returns:
+            List[Dict[str, Any]]: The dictionary representations of the items.
+        """
+        items = self._items
+        if not items:
+            return []
+        to_dict_fn = getattr(type(items[0]), "to_dict", None)
+        if to_dict_fn is None:
+            # Primitive items serialize as themselves; skip the
+            # per-item calls and take one C-level copy.
+            return list(items)
+        return [to_dict_fn(item) for item in items]
+
+    def to_str(self) -> str:
+        """Convert the list into a string representation.
+
+        The default is a plain `repr` of the backing container; set the
+        `_pretty` class attribute to get the recursive pformat output.
+
+        Returns:
+            str: The string representation of the list.
+        """
+        if self._pretty:
+            return pprint.pformat(self.to_dict())
+        return repr(self._items)
+
+    def __repr__(self) -> str:
+        """Represent the list as the plain repr of its backing container.
+
+        Always takes the fast path regardless of `_pretty`, since reprs
+        are interpolated into logs and debugger views.
+
+        Returns:
+            str: The string representation of the list.
+        """
+        return repr(self._items)
+
+    def __len__(self) -> int:
+        """Get the number of items in the list.
+
+        Returns:
+            int: The number of items.
+        """
+        return len(self._items)
+
+    def __iter__(self):
+        """Iterate over the items of the list.
+
+        Exposes the backing container's native C-level iterator so
+        external loops bypass both the `items` property getter and the
+        `__getitem__`-based fallback protocol.
+
+        Returns:
+            Iterator[T]: The iterator over the items.
+        """
+        return iter(self._items)
+
+    def __getitem__(self, a_index: Union[int, slice]) -> Union[T, List[T]]:
+        """Get the item(s) at the given index or slice.
+
+        Args:
+            a_index (Union[int, slice]): The index or slice to look up.
+
+        Returns:
+            Union[T, List[T]]: The item(s) at the given position.
+        """
+        return self._items[a_index]
+
+    def __setitem__(self, a_index: int, a_item: T) -> None:
+        """Replace the item at the given index.
+
+        Args:
+            a_index (int): The index of the item to be replaced.
+            a_item (T): The item to be assigned.
+        """
+        self._items[a_index] = a_item
+
+    def __delitem__(self, a_index: Union[int, slice]) -> None:
+        """Delete the item(s) at the given index or slice.
+
+        Args:
+            a_index (Union[int, slice]): The index or slice to be deleted.
+        """
+        del self._items[a_index]
+
+    def __contains__(self, a_item: T) -> bool:
+        """Check whether an item is in the list.
+
+        Args:
+            a_item (T): The item to look for.
+
+        Returns:
+            bool: True if the item is in the list, False otherwise.
+        """
+        return a_item in self._items
+
+    def append(self, a_item: Union[T, List[T], "BaseList[T]"]) -> None:
+        """Append item(s) to the list.
+
+        This is a dispatching shim kept for back-compat; hot callers that
+        know their argument's shape should call :meth:`append_one` or
+        :meth:`extend` directly and skip the type check.
+
+        Args:
+            a_item (Union[T, List[T], BaseList[T]]): The item(s) to be appended.
+        """
+        if isinstance(a_item, (list, self.__class__)):
+            self.extend(a_item)
+        else:
+            self._append_item(a_item)
+
+    def append_one(self, a_item: T) -> None:
+        """Append a single item to the list.
+
+        Eviction on a full list follows the removal strategy chosen at
+        construction time.
+
+        Args:
+            a_item (T): The item to be appended.
+        """
+        self._append_item(a_item)
+
+    def extend(self, a_items: Union[List[T], "BaseList[T]"]) -> None:
+        """Append a batch of items to the list.
+
+        Unbounded lists and first-eviction deques take a single C-level
+        extend — the deque's `maxlen` discards the oldest overflow by
+        itself. Only last-eviction needs the per-item path, which binds
+        the append locally to avoid re-resolving it every iteration.
+
+        Args:
+            a_items (Union[List[T], BaseList[T]]): The items to be appended.
+        """
+        if self._evict is None:
+            self._items.extend(a_items)
+        else:
+            append_item = self._append_item
+            for item in a_items:
+                append_item(item)
+
+    def _append_item(self, a_item: T) -> None:
+        """Append a single item, evicting if the list is full.
+
+        With the `first` strategy the deque's `maxlen` handles eviction
+        natively and no size check runs here; `last` compares the backing
+        container's length directly, avoiding a `__len__` dispatch.
+
+        Args:
+            a_item (T): The item to be appended.
+        """
+        if self._evict is not None and len(self._items) >= self._max_size:
+            self._evict()
+        self._items.append(a_item)
+
+    def pop(self, a_index: int = -1) -> T:
+        """Remove and return the item at the given index.
+
+        Args:
+            a_index (int, optional): The index of the item to be removed.
+                Defaults to -1.
+
+        Returns:
+            T: The removed item.
+        """
+        if type(self._items) is list:
+            return self._items.pop(a_index)
+        if a_index == -1:
+            return self._items.pop()
+        if a_index == 0:
+            return self._items.popleft()
+        item = self._items[a_index]
+        del self._items[a_index]
+        return item
+
+    def clear(self) -> None:
+        """Remove all items from the list in place.
+
+        Clearing in place keeps the backing container (and any grown
+        capacity) alive for the next fill instead of releasing it and
+        reallocating, and leaves the `items` alias and the bound eviction
+        callable pointing at a valid container.
+        """
+        self._items.clear()
+
+    def copy(self, a_deep: bool = False) -> "BaseList[T]":
+        """Create a structural copy of the list.
+
+        The copy is shallow by default: the container is duplicated but
+        the items are shared. This skips `copy.deepcopy`'s memo dict and
+        `__reduce_ex__` dispatch, which is typically an order of magnitude
+        slower than the typed clone for flat containers. Pass
+        `a_deep=True` to also copy each item through its own `copy()`.
+
+        Args:
+            a_deep (bool, optional): Whether the items are copied as well.
+                Defaults to False.
+
+        Returns:
+            BaseList[T]: The copied list.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.name = self.name
+        clone._max_size = self._max_size
+        clone._removal_strategy = self._removal_strategy
+        if a_deep:
+            elements = [
+                item.copy() if hasattr(item, "copy") else deepcopy(item) for item in self._items
+            ]
+        else:
+            elements = self._items
+        clone._evict = None
+        if self._max_size != -1:
+            clone._items = deque(elements, maxlen=self._max_size)
+            if self._removal_strategy == "last":
+                clone._evict = clone._items.pop
+        else:
+            clone._items = list(elements)
+        clone.items = clone._items
+        return clone
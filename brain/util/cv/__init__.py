@@ -0,0 +1 @@
+"""Computer Vision Subpackage"""
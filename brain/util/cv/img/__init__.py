@@ -0,0 +1,4 @@
+"""Image Subpackage"""
+
+from brain.util.cv.img.frm import Frame2D, Frame2DList
+from brain.util.cv.img.img import Image2D
@@ -0,0 +1,132 @@
+"""Frame Module
+
+This module defines :class:`Frame2D`, a video frame with a sequence
+identifier, and :class:`Frame2DList`, a size-bounded cache of frames.
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from brain.util.cnt.b_list import BaseList
+from brain.util.cv.img.img import Image2D
+from brain.util.misc.dtype import is_int
+
+
+class Frame2D(Image2D):
+    """Frame2D
+
+    A 2D video frame. In addition to the image data, it carries the
+    sequence identifier of the frame within its source video stream.
+
+    Attributes:
+        sequence_id (int): The sequence identifier of the frame.
+    """
+
+    __slots__ = ("_sequence_id",)
+
+    def __init__(
+        self,
+        a_data: np.ndarray,
+        a_sequence_id: int = 0,
+        a_filename: Optional[str] = None,
+        a_name: str = "FRAME2D",
+    ) -> None:
+        """Constructor of the frame.
+
+        Args:
+            a_data (np.ndarray): The pixel data of the frame with shape
+                (H, W) or (H, W, C).
+            a_sequence_id (int, optional): The sequence identifier of the
+                frame within its source stream. Defaults to 0.
+            a_filename (str, optional): The filename the frame was loaded
+                from. Defaults to None.
+            a_name (str, optional): The name of the frame. Defaults to `FRAME2D`.
+        """
+        super().__init__(a_data=a_data, a_filename=a_filename, a_name=a_name)
+        self.sequence_id = a_sequence_id
+
+    @classmethod
+    def _unchecked(
+        cls,
+        a_data: np.ndarray,
+        a_sequence_id: int = 0,
+        a_filename: Optional[str] = None,
+        a_name: str = "FRAME2D",
+    ) -> "Frame2D":
+        """Construct a frame without running any validation.
+
+        See :meth:`Image2D._unchecked`; this additionally writes the
+        sequence identifier straight into its slot.
+
+        Args:
+            a_data (np.ndarray): The pre-validated pixel data.
+            a_sequence_id (int, optional): The sequence identifier of the
+                frame. Defaults to 0.
+            a_filename (str, optional): The filename of the frame.
+                Defaults to None.
+            a_name (str, optional): The pre-normalized name of the frame.
+                Defaults to `FRAME2D`.
+
+        Returns:
+            Frame2D: The constructed frame.
+        """
+        frame = super()._unchecked(a_data=a_data, a_filename=a_filename, a_name=a_name)
+        frame._sequence_id = a_sequence_id
+        return frame
+
+    @property
+    def sequence_id(self) -> int:
+        """int: The sequence identifier of the frame."""
+        return self._sequence_id
+
+    @sequence_id.setter
+    def sequence_id(self, a_sequence_id: int) -> None:
+        """Set the sequence identifier of the frame.
+
+        Args:
+            a_sequence_id (int): The sequence identifier to be assigned.
+
+        Raises:
+            TypeError: If `a_sequence_id` is not an integer.
+        """
+        if not is_int(a_sequence_id):
+            raise TypeError(f"`a_sequence_id` must be an `int`, but it is given as `{type(a_sequence_id)}`.")
+        self._sequence_id = int(a_sequence_id)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the frame into a dictionary representation.
+
+        Returns:
+            Dict[str, Any]: The dictionary representation of the frame.
+        """
+        frame_dict = super().to_dict()
+        frame_dict["sequence_id"] = self._sequence_id
+        return frame_dict
+
+
+class Frame2DList(BaseList[Frame2D]):
+    """Frame2D List
+
+    A size-bounded ring buffer of frames, typically used as the streaming
+    cache of a video source. The storage is a :class:`collections.deque`
+    with `maxlen`, so appending a frame to a full cache evicts the oldest
+    one in O(1) instead of shifting the whole list.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        a_name: str = "FRAME2D_LIST",
+        a_max_size: int = -1,
+    ) -> None:
+        """Constructor of the frame list.
+
+        Args:
+            a_name (str, optional): The name of the list.
+                Defaults to `FRAME2D_LIST`.
+            a_max_size (int, optional): The maximum number of frames the list
+                may hold, or -1 for an unbounded list. Defaults to -1.
+        """
+        super().__init__(a_name=a_name, a_max_size=a_max_size)
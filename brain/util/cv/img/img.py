@@ -0,0 +1,164 @@
+"""Image Module
+
+This module defines :class:`Image2D`, a 2D image backed by a NumPy array
+in either grayscale (H, W) or color (H, W, C) layout.
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from brain.util.cv.shape.sz.size import Size
+from brain.util.obj.obj import BaseObject
+
+
+class Image2D(BaseObject):
+    """Image2D
+
+    A 2D image backed by a NumPy array.
+
+    Attributes:
+        data (np.ndarray): The pixel data of the image with shape (H, W)
+            or (H, W, C).
+        filename (Optional[str]): The filename the image was loaded from,
+            if any.
+    """
+
+    __slots__ = ("_data", "_filename", "_width", "_height", "_channels", "_size")
+
+    def __init__(
+        self,
+        a_data: np.ndarray,
+        a_filename: Optional[str] = None,
+        a_name: str = "IMAGE2D",
+    ) -> None:
+        """Constructor of the image.
+
+        Args:
+            a_data (np.ndarray): The pixel data of the image with shape
+                (H, W) or (H, W, C).
+            a_filename (str, optional): The filename the image was loaded
+                from. Defaults to None.
+            a_name (str, optional): The name of the image. Defaults to `IMAGE2D`.
+        """
+        super().__init__(a_name=a_name)
+        self.data = a_data
+        self.filename = a_filename
+
+    @property
+    def data(self) -> np.ndarray:
+        """np.ndarray: The pixel data of the image."""
+        return self._data
+
+    @data.setter
+    def data(self, a_data: np.ndarray) -> None:
+        """Set the pixel data of the image.
+
+        The type and dimensionality checks run only under `__debug__`, so
+        per-frame construction pays no validation cost under `python -O`.
+
+        Args:
+            a_data (np.ndarray): The pixel data to be assigned.
+
+        Raises:
+            TypeError: If `a_data` is not a NumPy array.
+            ValueError: If `a_data` is not 2- or 3-dimensional.
+        """
+        if __debug__:
+            if not isinstance(a_data, np.ndarray):
+                raise TypeError(f"`a_data` must be a `np.ndarray`, but it is given as `{type(a_data)}`.")
+            if a_data.ndim not in (2, 3):
+                raise ValueError(f"`a_data` must have 2 or 3 dimensions, but it has `{a_data.ndim}`.")
+        self._data = a_data
+        # The shape is fixed until `data` is reassigned, so the geometry is
+        # computed once here instead of on every property access.
+        self._height = a_data.shape[0]
+        self._width = a_data.shape[1]
+        self._channels = 1 if a_data.ndim == 2 else a_data.shape[2]
+        self._size = None
+
+    @classmethod
+    def _unchecked(
+        cls,
+        a_data: np.ndarray,
+        a_filename: Optional[str] = None,
+        a_name: str = "IMAGE2D",
+    ) -> "Image2D":
+        """Construct an image without running any validation.
+
+        The values are written straight into the slots, bypassing the
+        property setters. Intended for internal callers (e.g. the camera
+        frame path) that construct images at frame rate from data that is
+        already known to be a valid 2D/3D array.
+
+        Args:
+            a_data (np.ndarray): The pre-validated pixel data.
+            a_filename (str, optional): The filename of the image.
+                Defaults to None.
+            a_name (str, optional): The pre-normalized name of the image.
+                Defaults to `IMAGE2D`.
+
+        Returns:
+            Image2D: The constructed image.
+        """
+        image = object.__new__(cls)
+        image._name = a_name
+        image._filename = a_filename
+        image._data = a_data
+        image._height = a_data.shape[0]
+        image._width = a_data.shape[1]
+        image._channels = 1 if a_data.ndim == 2 else a_data.shape[2]
+        image._size = None
+        return image
+
+    @property
+    def filename(self) -> Optional[str]:
+        """Optional[str]: The filename the image was loaded from."""
+        return self._filename
+
+    @filename.setter
+    def filename(self, a_filename: Optional[str]) -> None:
+        """Set the filename of the image.
+
+        Args:
+            a_filename (Optional[str]): The filename to be assigned.
+
+        Raises:
+            TypeError: If `a_filename` is neither a string nor None.
+        """
+        if a_filename is not None and not isinstance(a_filename, str):
+            raise TypeError(f"`a_filename` must be a `str`, but it is given as `{type(a_filename)}`.")
+        self._filename = a_filename
+
+    @property
+    def width(self) -> int:
+        """int: The cached width of the image in pixels."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """int: The cached height of the image in pixels."""
+        return self._height
+
+    @property
+    def channels(self) -> int:
+        """int: The cached number of channels of the image."""
+        return self._channels
+
+    @property
+    def size(self) -> Size:
+        """Size: The (width, height) size of the image.
+
+        The size object is built once per data assignment and cached.
+        """
+        if self._size is None:
+            self._size = Size(self._width, self._height, a_name=f"{self.name} Size")
+        return self._size
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the image into a dictionary representation.
+
+        Returns:
+            Dict[str, Any]: The dictionary representation of the image.
+        """
+        return {"name": self.name, "filename": self._filename, "data": self._data}
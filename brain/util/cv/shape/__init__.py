@@ -0,0 +1 @@
+"""Shape Subpackage"""
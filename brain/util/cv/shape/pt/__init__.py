@@ -0,0 +1,4 @@
+"""Point Subpackage"""
+
+from brain.util.cv.shape.pt.key_point import KeyPoint2D, KeyPoint2DList
+from brain.util.cv.shape.pt.point import Point2D, Point2DList
@@ -0,0 +1,298 @@
+"""Key Point Module
+
+This module defines :class:`KeyPoint2D`, a scored 2D key point, and
+:class:`KeyPoint2DList`, a container of 2D key points.
+"""
+
+import math
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from brain.util.cv.shape.pt.point import Point2D, Point2DList
+from brain.util.misc.dtype import is_float, is_int
+
+
+class KeyPoint2D(Point2D):
+    """KeyPoint2D
+
+    A 2D key point described by x and y coordinates and an optional
+    confidence score.
+
+    Attributes:
+        score (Optional[float]): The confidence score of the key point.
+    """
+
+    __slots__ = ("_score",)
+
+    def __init__(
+        self,
+        a_x: Union[int, float],
+        a_y: Union[int, float],
+        a_score: Optional[float] = None,
+        a_name: str = "KEYPOINT2D",
+    ) -> None:
+        """Constructor of the key point.
+
+        Args:
+            a_x (Union[int, float]): The x coordinate of the key point.
+            a_y (Union[int, float]): The y coordinate of the key point.
+            a_score (float, optional): The confidence score of the key point.
+                Defaults to None.
+            a_name (str, optional): The name of the key point.
+                Defaults to `KEYPOINT2D`.
+        """
+        super().__init__(a_x=a_x, a_y=a_y, a_name=a_name)
+        self.score = a_score
+
+    @property
+    def score(self) -> Optional[float]:
+        """Optional[float]: The confidence score of the key point."""
+        return self._score
+
+    @score.setter
+    def score(self, a_score: Optional[float]) -> None:
+        """Set the confidence score of the key point.
+
+        Args:
+            a_score (Optional[float]): The score to be assigned.
+
+        Raises:
+            TypeError: If `a_score` is neither a numeric scalar nor None.
+        """
+        if a_score is not None and not is_float(a_score) and not is_int(a_score):
+            raise TypeError(f"`a_score` must be numeric, but it is given as `{type(a_score)}`.")
+        self._score = float(a_score) if a_score is not None else None
+
+    @classmethod
+    def validate_array(cls, a_coordinates: Union[np.ndarray, list, tuple]) -> np.ndarray:
+        """Validate an (x, y[, score]) coordinate array.
+
+        Args:
+            a_coordinates (Union[np.ndarray, list, tuple]): The coordinates to
+                be validated.
+
+        Returns:
+            np.ndarray: The validated coordinates as a flat array.
+
+        Raises:
+            ValueError: If the coordinates do not have 2 or 3 elements.
+        """
+        coordinates = np.array(a_coordinates, dtype=np.float32).reshape(-1)
+        if coordinates.size not in (2, 3):
+            raise ValueError(
+                f"`a_coordinates` must have 2 or 3 elements, but it has `{coordinates.size}`."
+            )
+        return coordinates
+
+    @classmethod
+    def _unchecked(
+        cls,
+        a_x: float,
+        a_y: float,
+        a_score: Optional[float] = None,
+        a_name: str = "KEYPOINT2D",
+    ) -> "KeyPoint2D":
+        """Construct a key point without running any validation.
+
+        The values are written straight into the slots, bypassing the
+        property setters. Intended for internal callers that have already
+        validated them (e.g. rows of a validated coordinate array).
+
+        Args:
+            a_x (float): The pre-validated x coordinate.
+            a_y (float): The pre-validated y coordinate.
+            a_score (float, optional): The pre-validated score.
+                Defaults to None.
+            a_name (str, optional): The pre-normalized name of the key point.
+                Defaults to `KEYPOINT2D`.
+
+        Returns:
+            KeyPoint2D: The constructed key point.
+        """
+        keypoint = object.__new__(cls)
+        keypoint._name = a_name
+        keypoint._x = a_x
+        keypoint._y = a_y
+        keypoint._score = a_score
+        return keypoint
+
+    @classmethod
+    def from_xy(
+        cls,
+        a_coordinates: Union[np.ndarray, list, tuple],
+        a_name: str = "KEYPOINT2D",
+    ) -> "KeyPoint2D":
+        """Create a key point from an (x, y[, score]) coordinate array.
+
+        A flat ndarray of the right size skips the conversion in
+        :meth:`validate_array`; validation then happens exactly once per
+        call instead of once per wrapper layer.
+
+        Args:
+            a_coordinates (Union[np.ndarray, list, tuple]): The coordinates of
+                the key point.
+            a_name (str, optional): The name of the key point.
+                Defaults to `KEYPOINT2D`.
+
+        Returns:
+            KeyPoint2D: The created key point.
+        """
+        if (
+            type(a_coordinates) is np.ndarray
+            and a_coordinates.ndim == 1
+            and a_coordinates.size in (2, 3)
+        ):
+            coordinates = a_coordinates
+        else:
+            coordinates = cls.validate_array(a_coordinates)
+        score = float(coordinates[2]) if coordinates.size == 3 else None
+        return cls(a_x=float(coordinates[0]), a_y=float(coordinates[1]), a_score=score, a_name=a_name)
+
+    def to_numpy(self) -> np.ndarray:
+        """Convert the key point into a NumPy array.
+
+        Returns:
+            np.ndarray: The (x, y[, score]) values as an array of shape (2,)
+                or (3,).
+        """
+        if self._score is not None:
+            return np.asarray([self._x, self._y, self._score])
+        return np.asarray([self._x, self._y])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the key point into a dictionary representation.
+
+        Returns:
+            Dict[str, Any]: The dictionary representation of the key point.
+        """
+        return {"name": self.name, "x": self._x, "y": self._y, "score": self._score}
+
+
+class KeyPoint2DList(Point2DList):
+    """KeyPoint2D List
+
+    A container of 2D key points whose canonical storage is a contiguous
+    (N, 3) float32 array of (x, y, score) rows (structure-of-arrays
+    layout). Missing scores are stored as NaN. :class:`KeyPoint2D`
+    instances are constructed lazily only when an element is accessed.
+    """
+
+    _cols: int = 3
+
+    def __init__(
+        self,
+        a_name: str = "KEYPOINT2D_LIST",
+        a_max_size: int = -1,
+        a_items=None,
+    ) -> None:
+        """Constructor of the key point list.
+
+        Args:
+            a_name (str, optional): The name of the list.
+                Defaults to `KEYPOINT2D_LIST`.
+            a_max_size (int, optional): The maximum number of key points the
+                list may hold, or -1 for an unbounded list. Defaults to -1.
+            a_items (Union[KeyPoint2D, List[KeyPoint2D], KeyPoint2DList,
+                np.ndarray], optional): Initial key point(s) to populate the
+                list with. Defaults to None.
+        """
+        super().__init__(a_name=a_name, a_max_size=a_max_size, a_items=a_items)
+
+    def _point_of(self, a_row: np.ndarray) -> KeyPoint2D:
+        """Construct a key point object from a stored coordinate row.
+
+        Args:
+            a_row (np.ndarray): The (x, y, score) row of the key point.
+
+        Returns:
+            KeyPoint2D: The constructed key point.
+        """
+        score = float(a_row[2])
+        return KeyPoint2D._unchecked(
+            float(a_row[0]), float(a_row[1]), a_score=None if math.isnan(score) else score
+        )
+
+    def _row_of(self, a_item: KeyPoint2D) -> Tuple[float, ...]:
+        """Convert a key point object into an (x, y, score) row.
+
+        Args:
+            a_item (KeyPoint2D): The key point to be converted.
+
+        Returns:
+            Tuple[float, ...]: The (x, y, score) row; a missing score is
+                stored as NaN.
+        """
+        score = getattr(a_item, "score", None)
+        return float(a_item.x), float(a_item.y), float("nan") if score is None else float(score)
+
+    def append(self, a_item) -> None:
+        """Append key point(s) to the list.
+
+        Args:
+            a_item (Union[KeyPoint2D, List[KeyPoint2D], KeyPoint2DList,
+                np.ndarray]): The key point(s) to be appended. Arrays are
+                interpreted as (M, 2|3) coordinate rows; 2-column rows get a
+                NaN score.
+        """
+        if isinstance(a_item, np.ndarray):
+            rows = np.asarray(a_item, dtype=np.float32).reshape(-1, a_item.shape[-1] if a_item.ndim > 1 else a_item.size)
+            if rows.shape[1] == 2:
+                rows = np.concatenate(
+                    [rows, np.full((rows.shape[0], 1), np.nan, dtype=np.float32)], axis=1
+                )
+            self._append_rows(rows)
+        else:
+            super().append(a_item)
+
+    @classmethod
+    def from_xy(
+        cls,
+        a_coordinates: Union[np.ndarray, list, tuple],
+        a_name: str = "KEYPOINT2D_LIST",
+    ) -> "KeyPoint2DList":
+        """Create a key point list from an (N, 2|3) coordinate array.
+
+        The coordinates are validated once and copied straight into the
+        backing array; no per-row key point object is created.
+
+        Args:
+            a_coordinates (Union[np.ndarray, list, tuple]): The per-row
+                (x, y[, score]) coordinates of the key points.
+            a_name (str, optional): The name of the list.
+                Defaults to `KEYPOINT2D_LIST`.
+
+        Returns:
+            KeyPoint2DList: The created key point list.
+
+        Raises:
+            ValueError: If the coordinate rows do not have 2 or 3 columns.
+        """
+        coordinates = np.array(a_coordinates, dtype=np.float32)
+        if coordinates.ndim != 2 or coordinates.shape[1] not in (2, 3):
+            raise ValueError(
+                f"`a_coordinates` must have shape (N, 2) or (N, 3), "
+                f"but it is given as `{coordinates.shape}`."
+            )
+        keypoints = cls(a_name=a_name)
+        keypoints._append_rows(
+            coordinates
+            if coordinates.shape[1] == 3
+            else np.concatenate(
+                [coordinates, np.full((coordinates.shape[0], 1), np.nan, dtype=np.float32)], axis=1
+            )
+        )
+        return keypoints
+
+    def to_xy(self) -> np.ndarray:
+        """Convert the key points into an (N, 2|3) coordinate array.
+
+        Returns:
+            np.ndarray: A view of the stored (N, 3) rows when scores are
+                present, otherwise a view of the (N, 2) coordinates; no copy
+                is made.
+        """
+        view = self._data[: self._size]
+        if self._size and not np.any(np.isnan(view[:, 2])):
+            return view
+        return view[:, :2]
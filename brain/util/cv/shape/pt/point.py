@@ -0,0 +1,402 @@
+"""Point Module
+
+This module defines :class:`Point2D`, a 2D point, and
+:class:`Point2DList`, a container of 2D points backed by a contiguous
+coordinate array.
+"""
+
+import math
+from typing import Any, Dict, Iterator, List, Tuple, Union
+
+import numpy as np
+
+from brain.util.cv.shape.pt._fast import speeds_batch
+from brain.util.misc.dtype import is_float, is_int
+from brain.util.obj.obj import BaseObject
+
+
+class Point2D(BaseObject):
+    """Point2D
+
+    A 2D point described by x and y coordinates.
+
+    Attributes:
+        x (Union[int, float]): The x coordinate of the point.
+        y (Union[int, float]): The y coordinate of the point.
+    """
+
+    __slots__ = ("_x", "_y")
+
+    def __init__(
+        self,
+        a_x: Union[int, float],
+        a_y: Union[int, float],
+        a_name: str = "POINT2D",
+    ) -> None:
+        """Constructor of the point.
+
+        Args:
+            a_x (Union[int, float]): The x coordinate of the point.
+            a_y (Union[int, float]): The y coordinate of the point.
+            a_name (str, optional): The name of the point. Defaults to `POINT2D`.
+        """
+        super().__init__(a_name=a_name)
+        self.x = a_x
+        self.y = a_y
+
+    @property
+    def x(self) -> Union[int, float]:
+        """Union[int, float]: The x coordinate of the point."""
+        return self._x
+
+    @x.setter
+    def x(self, a_x: Union[int, float]) -> None:
+        """Set the x coordinate of the point.
+
+        Built-in `int`/`float` values are stored as-is through a single
+        type-identity check; NumPy scalars fall back to the predicate path
+        and are converted once.
+
+        Args:
+            a_x (Union[int, float]): The x coordinate to be assigned.
+
+        Raises:
+            TypeError: If `a_x` is not a numeric scalar.
+        """
+        if type(a_x) is int or type(a_x) is float:
+            self._x = a_x
+        elif is_int(a_x):
+            self._x = int(a_x)
+        elif is_float(a_x):
+            self._x = float(a_x)
+        else:
+            raise TypeError(f"`a_x` must be numeric, but it is given as `{type(a_x)}`.")
+
+    @property
+    def y(self) -> Union[int, float]:
+        """Union[int, float]: The y coordinate of the point."""
+        return self._y
+
+    @y.setter
+    def y(self, a_y: Union[int, float]) -> None:
+        """Set the y coordinate of the point.
+
+        Built-in `int`/`float` values are stored as-is through a single
+        type-identity check; NumPy scalars fall back to the predicate path
+        and are converted once.
+
+        Args:
+            a_y (Union[int, float]): The y coordinate to be assigned.
+
+        Raises:
+            TypeError: If `a_y` is not a numeric scalar.
+        """
+        if type(a_y) is int or type(a_y) is float:
+            self._y = a_y
+        elif is_int(a_y):
+            self._y = int(a_y)
+        elif is_float(a_y):
+            self._y = float(a_y)
+        else:
+            raise TypeError(f"`a_y` must be numeric, but it is given as `{type(a_y)}`.")
+
+    @classmethod
+    def _unchecked(cls, a_x: float, a_y: float, a_name: str = "POINT2D") -> "Point2D":
+        """Construct a point without running any validation.
+
+        The coordinates are written straight into the slots, bypassing the
+        property setters. Intended for internal callers that have already
+        validated the values (e.g. rows of a validated coordinate array).
+
+        Args:
+            a_x (float): The pre-validated x coordinate.
+            a_y (float): The pre-validated y coordinate.
+            a_name (str, optional): The pre-normalized name of the point.
+                Defaults to `POINT2D`.
+
+        Returns:
+            Point2D: The constructed point.
+        """
+        point = object.__new__(cls)
+        point._name = a_name
+        point._x = a_x
+        point._y = a_y
+        return point
+
+    def to_numpy(self) -> np.ndarray:
+        """Convert the point into a NumPy array.
+
+        Returns:
+            np.ndarray: The (x, y) coordinates as an array of shape (2,).
+        """
+        return np.asarray([self._x, self._y])
+
+    def to_tuple(self) -> Tuple[Union[int, float], Union[int, float]]:
+        """Convert the point into an (x, y) tuple.
+
+        Returns:
+            Tuple[Union[int, float], Union[int, float]]: The coordinate tuple.
+        """
+        return self._x, self._y
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the point into a dictionary representation.
+
+        Returns:
+            Dict[str, Any]: The dictionary representation of the point.
+        """
+        return {"name": self.name, "x": self._x, "y": self._y}
+
+    def speed(self, a_point2d: "Point2D") -> Tuple[float, float]:
+        """Compute the normalized direction of motion towards another point.
+
+        Args:
+            a_point2d (Point2D): The destination point.
+
+        Returns:
+            Tuple[float, float]: The normalized (dy, dx) direction vector.
+        """
+        dx = a_point2d.x - self._x
+        dy = a_point2d.y - self._y
+        norm = math.hypot(dx, dy) + 1e-10
+        return dy / norm, dx / norm
+
+    def __eq__(self, a_other: object) -> bool:
+        """Check whether two points have equal coordinates.
+
+        Args:
+            a_other (object): The point to compare against.
+
+        Returns:
+            bool: True if both coordinates match, False otherwise.
+        """
+        if not isinstance(a_other, Point2D):
+            return NotImplemented
+        return self._x == a_other.x and self._y == a_other.y
+
+
+class Point2DList(BaseObject):
+    """Point2D List
+
+    A container of 2D points whose canonical storage is a contiguous
+    (N, 2) float32 coordinate array (structure-of-arrays layout). Batch
+    geometric operations work directly on the array without touching any
+    per-point Python object; :class:`Point2D` instances are constructed
+    lazily only when an element is accessed.
+
+    Attributes:
+        ndarray (np.ndarray): The (N, `_cols`) view of the stored coordinates.
+    """
+
+    _cols: int = 2
+
+    def __init__(
+        self,
+        a_name: str = "POINT2D_LIST",
+        a_max_size: int = -1,
+        a_items=None,
+    ) -> None:
+        """Constructor of the point list.
+
+        Args:
+            a_name (str, optional): The name of the list.
+                Defaults to `POINT2D_LIST`.
+            a_max_size (int, optional): The maximum number of points the list
+                may hold, or -1 for an unbounded list. Defaults to -1.
+            a_items (Union[Point2D, List[Point2D], Point2DList, np.ndarray],
+                optional): Initial point(s) to populate the list with.
+                Defaults to None.
+        """
+        super().__init__(a_name=a_name)
+        self._max_size: int = int(a_max_size)
+        self._data: np.ndarray = np.empty((0, self._cols), dtype=np.float32)
+        self._size: int = 0
+        if a_items is not None:
+            self.append(a_items)
+
+    @property
+    def max_size(self) -> int:
+        """int: The maximum number of points the list may hold (-1 if unbounded)."""
+        return self._max_size
+
+    @property
+    def ndarray(self) -> np.ndarray:
+        """np.ndarray: The (N, `_cols`) view of the stored coordinates."""
+        return self._data[: self._size]
+
+    @property
+    def items(self) -> List[Point2D]:
+        """List[Point2D]: The points of the list as lazily built objects."""
+        return [self[i] for i in range(self._size)]
+
+    def _point_of(self, a_row: np.ndarray) -> Point2D:
+        """Construct a point object from a stored coordinate row.
+
+        Args:
+            a_row (np.ndarray): The coordinate row of the point.
+
+        Returns:
+            Point2D: The constructed point.
+        """
+        return Point2D._unchecked(float(a_row[0]), float(a_row[1]))
+
+    def _row_of(self, a_item: Point2D) -> Tuple[float, ...]:
+        """Convert a point object into a coordinate row.
+
+        Args:
+            a_item (Point2D): The point to be converted.
+
+        Returns:
+            Tuple[float, ...]: The coordinate row of the point.
+        """
+        return float(a_item.x), float(a_item.y)
+
+    def _reserve(self, a_extra: int) -> None:
+        """Grow the backing array so it can hold `a_extra` more rows.
+
+        The capacity is grown geometrically so repeated appends amortize
+        to O(1) per row.
+
+        Args:
+            a_extra (int): The number of additional rows to reserve.
+        """
+        needed = self._size + a_extra
+        capacity = self._data.shape[0]
+        if needed > capacity:
+            new_capacity = max(4, capacity * 2, needed)
+            data = np.empty((new_capacity, self._cols), dtype=np.float32)
+            data[: self._size] = self._data[: self._size]
+            self._data = data
+
+    def _append_rows(self, a_rows: np.ndarray) -> None:
+        """Append coordinate rows, evicting the oldest rows if full.
+
+        Args:
+            a_rows (np.ndarray): The (M, `_cols`) rows to be appended.
+        """
+        count = a_rows.shape[0]
+        if self._max_size != -1:
+            if count >= self._max_size:
+                a_rows = a_rows[-self._max_size :]
+                count = a_rows.shape[0]
+                self._size = 0
+            elif self._size + count > self._max_size:
+                drop = self._size + count - self._max_size
+                self._data[: self._size - drop] = self._data[drop : self._size]
+                self._size -= drop
+        self._reserve(count)
+        self._data[self._size : self._size + count] = a_rows
+        self._size += count
+
+    def append(self, a_item) -> None:
+        """Append point(s) to the list.
+
+        Args:
+            a_item (Union[Point2D, List[Point2D], Point2DList, np.ndarray]):
+                The point(s) to be appended. Arrays are interpreted as
+                (M, `_cols`) coordinate rows.
+        """
+        if isinstance(a_item, Point2DList):
+            self._append_rows(a_item.ndarray)
+        elif isinstance(a_item, np.ndarray):
+            self._append_rows(np.asarray(a_item, dtype=np.float32).reshape(-1, self._cols))
+        elif isinstance(a_item, (list, tuple)):
+            self._append_rows(
+                np.asarray([self._row_of(item) for item in a_item], dtype=np.float32).reshape(
+                    -1, self._cols
+                )
+            )
+        else:
+            self._append_rows(np.asarray([self._row_of(a_item)], dtype=np.float32))
+
+    def to_xy(self) -> np.ndarray:
+        """Convert the points into an (N, 2) coordinate array.
+
+        Returns:
+            np.ndarray: A view of the stored (N, 2) coordinates; no copy is
+                made.
+        """
+        return self._data[: self._size]
+
+    def to_dict(self) -> List[Dict[str, Any]]:
+        """Convert the points of the list into dictionary representations.
+
+        Returns:
+            List[Dict[str, Any]]: The dictionary representations of the points.
+        """
+        return [self[i].to_dict() for i in range(self._size)]
+
+    def __len__(self) -> int:
+        """Get the number of points in the list.
+
+        Returns:
+            int: The number of points.
+        """
+        return self._size
+
+    def __getitem__(self, a_index: Union[int, slice]) -> Union[Point2D, List[Point2D]]:
+        """Get the lazily constructed point(s) at the given index or slice.
+
+        Args:
+            a_index (Union[int, slice]): The index or slice to look up.
+
+        Returns:
+            Union[Point2D, List[Point2D]]: The point(s) at the given position.
+        """
+        view = self._data[: self._size]
+        if isinstance(a_index, slice):
+            return [self._point_of(row) for row in view[a_index]]
+        return self._point_of(view[a_index])
+
+    def __iter__(self) -> Iterator[Point2D]:
+        """Iterate over the lazily constructed points of the list.
+
+        Yields:
+            Point2D: The next point of the list.
+        """
+        for row in self._data[: self._size]:
+            yield self._point_of(row)
+
+    def __contains__(self, a_item: Point2D) -> bool:
+        """Check whether a point with equal coordinates is in the list.
+
+        Args:
+            a_item (Point2D): The point to look for.
+
+        Returns:
+            bool: True if a matching point is in the list, False otherwise.
+        """
+        view = self._data[: self._size]
+        return bool(np.any(np.all(view[:, :2] == (a_item.x, a_item.y), axis=1)))
+
+    def speeds_to(self, a_other: "Point2DList") -> np.ndarray:
+        """Compute the normalized directions of motion towards other points.
+
+        The batched counterpart of :meth:`Point2D.speed`: all N directions
+        are computed in one pass over the coordinate arrays by the
+        JIT-compiled kernel in :mod:`brain.util.cv.shape.pt._fast` instead
+        of one Python-level call per point.
+
+        Args:
+            a_other (Point2DList): The destination points, matching this
+                list in length.
+
+        Returns:
+            np.ndarray: The (N, 2) array of normalized (dy, dx) direction
+                vectors.
+
+        Raises:
+            ValueError: If the two lists have different lengths.
+        """
+        if len(a_other) != self._size:
+            raise ValueError(
+                f"`a_other` must have the same length, but it is given as "
+                f"`{len(a_other)}` instead of `{self._size}`."
+            )
+        src = np.ascontiguousarray(self._data[: self._size, :2])
+        dst = np.ascontiguousarray(a_other.ndarray[:, :2])
+        return speeds_batch(src, dst)
+
+    def clear(self) -> None:
+        """Remove all points from the list, keeping the backing storage."""
+        self._size = 0
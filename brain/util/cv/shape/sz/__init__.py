@@ -0,0 +1,3 @@
+"""Size Subpackage"""
+
+from brain.util.cv.shape.sz.size import Size
@@ -0,0 +1,115 @@
+"""Size Module
+
+This module defines :class:`Size`, a 2D size described by a width and a
+height in pixels.
+"""
+
+from typing import Any, Dict, Tuple, Union
+
+from brain.util.misc.dtype import is_float, is_int
+from brain.util.obj.obj import BaseObject
+
+
+class Size(BaseObject):
+    """Size
+
+    A 2D size described by a width and a height.
+
+    Attributes:
+        width (Union[int, float]): The width of the size.
+        height (Union[int, float]): The height of the size.
+    """
+
+    __slots__ = ("_width", "_height")
+
+    def __init__(
+        self,
+        a_width: Union[int, float],
+        a_height: Union[int, float],
+        a_name: str = "SIZE",
+    ) -> None:
+        """Constructor of the size.
+
+        Args:
+            a_width (Union[int, float]): The width of the size.
+            a_height (Union[int, float]): The height of the size.
+            a_name (str, optional): The name of the size. Defaults to `SIZE`.
+        """
+        super().__init__(a_name=a_name)
+        self.width = a_width
+        self.height = a_height
+
+    @property
+    def width(self) -> Union[int, float]:
+        """Union[int, float]: The width of the size."""
+        return self._width
+
+    @width.setter
+    def width(self, a_width: Union[int, float]) -> None:
+        """Set the width of the size.
+
+        Args:
+            a_width (Union[int, float]): The width to be assigned.
+
+        Raises:
+            TypeError: If `a_width` is not a numeric scalar.
+        """
+        if not is_int(a_width) and not is_float(a_width):
+            raise TypeError(f"`a_width` must be numeric, but it is given as `{type(a_width)}`.")
+        self._width = a_width
+
+    @property
+    def height(self) -> Union[int, float]:
+        """Union[int, float]: The height of the size."""
+        return self._height
+
+    @height.setter
+    def height(self, a_height: Union[int, float]) -> None:
+        """Set the height of the size.
+
+        Args:
+            a_height (Union[int, float]): The height to be assigned.
+
+        Raises:
+            TypeError: If `a_height` is not a numeric scalar.
+        """
+        if not is_int(a_height) and not is_float(a_height):
+            raise TypeError(f"`a_height` must be numeric, but it is given as `{type(a_height)}`.")
+        self._height = a_height
+
+    def area(self) -> Union[int, float]:
+        """Compute the area of the size.
+
+        Returns:
+            Union[int, float]: The area (width * height).
+        """
+        return self._width * self._height
+
+    def to_tuple(self) -> Tuple[Union[int, float], Union[int, float]]:
+        """Convert the size into a (width, height) tuple.
+
+        Returns:
+            Tuple[Union[int, float], Union[int, float]]: The size tuple.
+        """
+        return self._width, self._height
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the size into a dictionary representation.
+
+        Returns:
+            Dict[str, Any]: The dictionary representation of the size.
+        """
+        return {"name": self.name, "width": self._width, "height": self._height}
+
+    def __eq__(self, a_other: object) -> bool:
+        """Check whether two sizes have equal dimensions.
+
+        Args:
+            a_other (object): The size to compare against.
+
+        Returns:
+            bool: True if both width and height match, False otherwise.
+        """
+        if not isinstance(a_other, Size):
+            return NotImplemented
+        return self._width == a_other.width and self._height == a_other.height
@@ -0,0 +1,4 @@
+"""Video Subpackage"""
+
+from brain.util.cv.vid.cv_cam import Camera
+from brain.util.cv.vid.vid import Video2D
@@ -0,0 +1,381 @@
+"""Camera Module
+
+This module defines :class:`Camera`, a live video source that
+continuously reads frames into a bounded cache and recovers from
+transient source failures.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+from brain.util.cv.img.frm import Frame2D, Frame2DList
+from brain.util.cv.vid.vid import Video2D
+
+
+class Camera(Video2D):
+    """Camera
+
+    A live video source (webcam, RTSP stream, etc.). Frames are read in a
+    streaming loop into a size-bounded :class:`Frame2DList` cache, and the
+    capture is reinitialized automatically on read failures.
+
+    RTSP sources are opened through a GStreamer pipeline with `latency=0`
+    and a drop-old-frames appsink when the OpenCV build supports the
+    GStreamer backend, which keeps the end-to-end latency at one frame
+    period instead of the growing FFMPEG buffer. The pipeline can be
+    customized per camera (e.g. `nvv4l2decoder` on Jetson hosts) via the
+    `a_gst_pipeline` template.
+
+    Attributes:
+        cache_size (int): The maximum number of frames kept in the cache.
+        reinit_interval (float): The wait time in seconds between
+            reinitialization trials.
+        max_reinit_trials (int): The maximum number of reinitialization
+            trials before giving up.
+        buffer_size (int): The driver-side capture queue depth requested
+            from the backend.
+        frames (Frame2DList): The cache of the most recent frames.
+    """
+
+    #: Default GStreamer pipeline template for RTSP sources. `decodebin`
+    #: auto-selects a hardware decoder when one is available.
+    _gst_pipeline_template: str = (
+        "rtspsrc location={a_source} latency=0 ! decodebin ! videoconvert "
+        "! video/x-raw,format=BGR ! appsink drop=1 max-buffers=1"
+    )
+    #: Emit at most one warning per this many dropped/failed frames.
+    _warn_every: int = 100
+    #: Initial wait in seconds of the exponential reinitialization backoff.
+    _backoff_base: float = 0.5
+    #: Timeout in milliseconds for opening the source and reading a frame.
+    _capture_timeout_msec: float = 2000.0
+
+    def __init__(
+        self,
+        a_source: Union[int, str],
+        a_backend: int = cv2.CAP_FFMPEG,
+        a_hw_acceleration: bool = True,
+        a_cache_size: int = 15,
+        a_reinit_interval: float = 5.0,
+        a_max_reinit_trials: int = 10,
+        a_buffer_size: int = 1,
+        a_decode_every: int = 1,
+        a_frame_timeout: float = 10.0,
+        a_gst_pipeline: Optional[str] = None,
+        a_name: str = "CAMERA",
+    ) -> None:
+        """Constructor of the camera.
+
+        Args:
+            a_source (Union[int, str]): The source of the camera (stream URL
+                or device index).
+            a_backend (int, optional): The OpenCV capture backend.
+                Defaults to `cv2.CAP_FFMPEG`.
+            a_hw_acceleration (bool, optional): Request hardware-accelerated
+                decoding from the backend, falling back to software decoding
+                if unavailable. Defaults to True.
+            a_cache_size (int, optional): The maximum number of frames kept
+                in the cache. Defaults to 15.
+            a_reinit_interval (float, optional): The wait time in seconds
+                between reinitialization trials. Defaults to 5.0.
+            a_max_reinit_trials (int, optional): The maximum number of
+                reinitialization trials before giving up. Defaults to 10.
+            a_buffer_size (int, optional): The driver-side capture queue
+                depth requested from the backend. Keeping it at 1 makes
+                `read` return the most recent frame instead of a stale
+                queued one. Defaults to 1.
+            a_decode_every (int, optional): Decode only every Nth grabbed
+                frame while streaming; intermediate frames are grabbed but
+                never decoded. Defaults to 1 (decode every frame).
+            a_frame_timeout (float, optional): The maximum time in seconds
+                the `frame` property waits for the first frame to arrive.
+                Defaults to 10.0.
+            a_gst_pipeline (str, optional): A GStreamer pipeline template for
+                RTSP sources with an `{a_source}` placeholder, overriding the
+                class default. Defaults to None.
+            a_name (str, optional): The name of the camera. Defaults to `CAMERA`.
+        """
+        self.gst_pipeline: Optional[str] = None
+        if (
+            isinstance(a_source, str)
+            and a_source.startswith("rtsp://")
+            and a_backend != cv2.CAP_GSTREAMER
+        ):
+            self.gst_pipeline = (a_gst_pipeline or self._gst_pipeline_template).format(
+                a_source=a_source
+            )
+        if self.gst_pipeline is not None:
+            try:
+                super().__init__(
+                    a_source=self.gst_pipeline,
+                    a_backend=cv2.CAP_GSTREAMER,
+                    a_hw_acceleration=False,
+                    a_name=a_name,
+                )
+            except RuntimeError:
+                # No GStreamer support (or pipeline failure): fall back to
+                # the requested backend with the plain URL.
+                self.gst_pipeline = None
+        if self.gst_pipeline is None:
+            super().__init__(
+                a_source=a_source,
+                a_backend=a_backend,
+                a_hw_acceleration=a_hw_acceleration,
+                a_name=a_name,
+            )
+        self.cache_size = int(a_cache_size)
+        self.reinit_interval = float(a_reinit_interval)
+        self.max_reinit_trials = int(a_max_reinit_trials)
+        self.buffer_size = int(a_buffer_size)
+        self.decode_every = max(1, int(a_decode_every))
+        self.logger = logging.getLogger(self.name)
+        self.frame_timeout = float(a_frame_timeout)
+        self.frames = Frame2DList(a_name=f"{a_name} Frames", a_max_size=self.cache_size)
+        self._current_frame_id: int = 0
+        self._warn_counter: int = 0
+        self._stopped: bool = False
+        self._frame_pool: Optional[List[Frame2D]] = None
+        self._pool_index: int = 0
+        self._configure_buffer_size()
+        self._configure_timeouts()
+        self._new_frame = threading.Event()
+        self._raw_frames: "queue.SimpleQueue[Optional[Tuple[np.ndarray, int]]]" = queue.SimpleQueue()
+        self._wrap_thread = threading.Thread(
+            target=self._wrap_worker, name=f"{self.name}-wrap", daemon=True
+        )
+        self._wrap_thread.start()
+        self._stream_thread = threading.Thread(target=self.stream, name=f"{self.name}-stream", daemon=True)
+        self._stream_thread.start()
+
+    def _configure_buffer_size(self) -> None:
+        """Request the configured capture queue depth from the backend.
+
+        Not every backend honors `CAP_PROP_BUFFERSIZE`; failures are
+        ignored and the backend default is kept.
+        """
+        try:
+            self.video_capture.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
+        except Exception:
+            pass
+
+    def _configure_timeouts(self) -> None:
+        """Bound how long the backend may block on opening and reading.
+
+        The FFMPEG backend otherwise blocks for its own defaults (seconds)
+        on a dead source, which stalls every reinitialization trial. Not
+        every backend supports the properties; failures are ignored.
+        """
+        try:
+            if hasattr(cv2, "CAP_PROP_OPEN_TIMEOUT_MSEC"):
+                self.video_capture.set(cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, self._capture_timeout_msec)
+            if hasattr(cv2, "CAP_PROP_READ_TIMEOUT_MSEC"):
+                self.video_capture.set(cv2.CAP_PROP_READ_TIMEOUT_MSEC, self._capture_timeout_msec)
+        except Exception:
+            pass
+
+    def _pooled_frame(self, a_raw: np.ndarray, a_sequence_id: int) -> Frame2D:
+        """Wrap a raw frame into a pooled, reused Frame2D object.
+
+        A ring of `cache_size + 1` Frame2D objects with preallocated pixel
+        buffers is kept and rebound in turn, so steady-state streaming does
+        not allocate a wrapper or a pixel buffer per frame. The extra slot
+        guarantees the slot being rebound has already been evicted from the
+        cache. Consumers must copy a frame they need to keep beyond
+        `cache_size` appends, as its buffer will be overwritten.
+
+        Args:
+            a_raw (np.ndarray): The raw decoded frame.
+            a_sequence_id (int): The sequence identifier of the frame.
+
+        Returns:
+            Frame2D: The pooled frame holding a copy of `a_raw`.
+        """
+        pool = self._frame_pool
+        if (
+            pool is None
+            or pool[0].data.shape != a_raw.shape
+            or pool[0].data.dtype != a_raw.dtype
+        ):
+            pool = [
+                Frame2D._unchecked(a_data=np.empty_like(a_raw), a_name=f"{self.name}_FRAME")
+                for _ in range(max(2, self.cache_size + 1))
+            ]
+            self._frame_pool = pool
+            self._pool_index = 0
+        frame = pool[self._pool_index]
+        self._pool_index = (self._pool_index + 1) % len(pool)
+        np.copyto(frame.data, a_raw)
+        frame.sequence_id = a_sequence_id
+        return frame
+
+    def _warn_failure(self, a_message: str) -> None:
+        """Log a frame failure, throttled to once per `_warn_every` failures.
+
+        The message is a %-style template taking the camera name and the
+        source, so no string is built unless the record is emitted.
+
+        Args:
+            a_message (str): The %-style warning template.
+        """
+        if self._warn_counter % self._warn_every == 0:
+            self.logger.warning(a_message, self.name, self.source)
+        self._warn_counter += 1
+
+    @property
+    def frame(self) -> Frame2D:
+        """Frame2D: The most recent frame in the cache.
+
+        If no frame has arrived yet, the call blocks until the acquisition
+        thread signals the first frame or `frame_timeout` elapses.
+
+        Raises:
+            TimeoutError: If no frame arrives within `frame_timeout`
+                seconds, or if the camera was stopped before a frame
+                arrived.
+        """
+        if len(self.frames) == 0:
+            # `stop()` sets the event to wake blocked consumers without a
+            # frame being available, so the cache must be re-checked after
+            # the wait rather than trusting the event alone.
+            self._new_frame.wait(self.frame_timeout)
+            if len(self.frames) == 0:
+                raise TimeoutError(
+                    f"`{self.name}` received no frame from the source `{self.source}` "
+                    f"within {self.frame_timeout} seconds."
+                )
+        return self.frames[-1]
+
+    def read(self) -> Tuple[bool, Optional[Frame2D]]:
+        """Read the most recent frame from the cache.
+
+        Acquisition is owned by the streaming thread, so this is a pure
+        cache pull: it never touches the capture handle or the frame
+        pool and is safe to call while streaming. Blocks like
+        :attr:`frame` until the first frame arrives.
+
+        Returns:
+            Tuple[bool, Optional[Frame2D]]: A success flag and the frame, or
+                (False, None) if no frame arrived within `frame_timeout`.
+        """
+        try:
+            return True, self.frame
+        except TimeoutError:
+            self._warn_failure("`%s` received no frame from the source `%s`.")
+            return False, None
+
+    def stream(self) -> None:
+        """Continuously read frames into the cache.
+
+        The loop runs on a dedicated daemon thread started by the
+        constructor and only performs grab()/retrieve(), both of which
+        release the GIL, so multiple cameras scale across cores. The raw
+        decoded arrays are handed to the wrap worker through a queue; all
+        Python-level wrapping happens off this thread.
+
+        Frames are acquired with grab()+retrieve() so that only every
+        `decode_every`-th frame pays the decode cost; skipped frames are
+        grabbed (advancing the stream) but never decoded. On failures the
+        capture is reinitialized and streaming resumes. The loop runs until
+        :meth:`stop` is called.
+        """
+        while not self._stopped:
+            ret = self.video_capture.grab()
+            if not ret:
+                self.reinitialize_camera()
+                continue
+            self._current_frame_id += 1
+            if self._current_frame_id % self.decode_every != 0:
+                continue
+            ret, frame = self.video_capture.retrieve()
+            if not ret or frame is None:
+                self._warn_failure("`%s` failed to retrieve a grabbed frame from the source `%s`.")
+                continue
+            self._raw_frames.put((frame, self._current_frame_id))
+        self._raw_frames.put(None)
+
+    def _wrap_worker(self) -> None:
+        """Wrap raw decoded frames into the cache.
+
+        Runs on its own daemon thread: it blocks on the raw-frame queue,
+        then drains whatever has accumulated in one batch, wrapping each
+        array into a pooled Frame2D and announcing it through the
+        `_new_frame` event. A `None` item shuts the worker down.
+        """
+        while True:
+            item = self._raw_frames.get()
+            while True:
+                if item is None:
+                    return
+                raw, sequence_id = item
+                self.frames.append(self._pooled_frame(raw, sequence_id))
+                self._new_frame.set()
+                try:
+                    item = self._raw_frames.get_nowait()
+                except queue.Empty:
+                    break
+
+    def reinitialize_camera(self) -> None:
+        """Reinitialize the camera after a source failure.
+
+        The wait between trials backs off exponentially from
+        `_backoff_base` seconds up to `reinit_interval`, so brief outages
+        recover quickly while a permanently dead source keeps a bounded
+        retry cost.
+
+        Raises:
+            RuntimeError: If the camera cannot be reopened within the
+                maximum number of trials.
+        """
+        for trial in range(self.max_reinit_trials):
+            self.logger.info(
+                "`%s` reinitialization trial %d/%d.", self.name, trial + 1, self.max_reinit_trials
+            )
+            try:
+                self.release()
+                self.initialize_video()
+                self._configure_buffer_size()
+                self._configure_timeouts()
+                if self.video_capture.isOpened():
+                    return
+            except Exception as error:
+                self.logger.warning("`%s` reinitialization failed: %s", self.name, error)
+            time.sleep(min(self.reinit_interval, self._backoff_base * 2**trial))
+        raise RuntimeError(
+            f"`{self.name}` could not reinitialize the source `{self.source}` "
+            f"after {self.max_reinit_trials} trials."
+        )
+
+    def stop(self) -> None:
+        """Stop the streaming loop and wake any blocked consumer."""
+        self._stopped = True
+        self._new_frame.set()
+        if self._stream_thread.is_alive() and threading.current_thread() is not self._stream_thread:
+            self._stream_thread.join(timeout=self.frame_timeout)
+        self._raw_frames.put(None)
+        if self._wrap_thread.is_alive() and threading.current_thread() is not self._wrap_thread:
+            self._wrap_thread.join(timeout=self.frame_timeout)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the camera into a dictionary representation.
+
+        Returns:
+            Dict[str, Any]: The dictionary representation of the camera.
+        """
+        camera_dict = super().to_dict()
+        camera_dict.update(
+            {
+                "cache_size": self.cache_size,
+                "reinit_interval": self.reinit_interval,
+                "max_reinit_trials": self.max_reinit_trials,
+                "buffer_size": self.buffer_size,
+                "decode_every": self.decode_every,
+                "gst_pipeline": self.gst_pipeline,
+            }
+        )
+        return camera_dict
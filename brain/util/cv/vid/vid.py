@@ -0,0 +1,119 @@
+"""Video Module
+
+This module defines :class:`Video2D`, a video source wrapped around
+OpenCV's :class:`cv2.VideoCapture`.
+"""
+
+from typing import Any, Dict, Optional, Union
+
+import cv2
+
+from brain.util.obj.obj import BaseObject
+
+
+class Video2D(BaseObject):
+    """Video2D
+
+    A video source backed by :class:`cv2.VideoCapture`. The source may be
+    a filename, a stream URL, or a device index.
+
+    Attributes:
+        source (Union[int, str]): The source of the video.
+        backend (int): The OpenCV capture backend of the video.
+        hw_acceleration (bool): Whether hardware-accelerated decoding is
+            requested from the backend.
+        video_capture (Optional[cv2.VideoCapture]): The capture handle of
+            the video.
+    """
+
+    def __init__(
+        self,
+        a_source: Union[int, str],
+        a_backend: int = cv2.CAP_FFMPEG,
+        a_hw_acceleration: bool = True,
+        a_name: str = "VIDEO2D",
+    ) -> None:
+        """Constructor of the video.
+
+        Args:
+            a_source (Union[int, str]): The source of the video (filename,
+                stream URL, or device index).
+            a_backend (int, optional): The OpenCV capture backend.
+                Defaults to `cv2.CAP_FFMPEG`.
+            a_hw_acceleration (bool, optional): Request hardware-accelerated
+                decoding (NVDEC/VAAPI/...) from the backend, falling back to
+                software decoding if the source cannot be opened with it.
+                Defaults to True.
+            a_name (str, optional): The name of the video. Defaults to `VIDEO2D`.
+        """
+        super().__init__(a_name=a_name)
+        self.source = a_source
+        self.backend = a_backend
+        self.hw_acceleration = bool(a_hw_acceleration)
+        self.video_capture: Optional[cv2.VideoCapture] = None
+        self.initialize_video()
+
+    def initialize_video(self) -> None:
+        """Initialize the video capture handle.
+
+        When hardware acceleration is requested and the OpenCV build
+        supports it, the capture is opened with
+        `VIDEO_ACCELERATION_ANY` so H.264/H.265 decoding runs on the
+        GPU/decoder block instead of the CPU. If the accelerated open
+        fails, the source is reopened with software decoding.
+
+        Raises:
+            RuntimeError: If the video source cannot be opened.
+        """
+        if self.hw_acceleration and hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+            # `CAP_PROP_HW_DEVICE` must not be combined with
+            # `VIDEO_ACCELERATION_ANY`: the FFmpeg backend rejects the
+            # pair and the accelerated open always fails, silently
+            # dropping every capture to software decoding. The device
+            # selection is left to the backend.
+            self.video_capture = cv2.VideoCapture(
+                self.source,
+                self.backend,
+                [
+                    cv2.CAP_PROP_HW_ACCELERATION,
+                    cv2.VIDEO_ACCELERATION_ANY,
+                ],
+            )
+            if self.video_capture.isOpened():
+                return
+        self.video_capture = cv2.VideoCapture(self.source, self.backend)
+        if not self.video_capture.isOpened():
+            raise RuntimeError(f"`{self.name}` could not open the video source `{self.source}`.")
+
+    @property
+    def fps(self) -> float:
+        """float: The frame rate of the video."""
+        return float(self.video_capture.get(cv2.CAP_PROP_FPS))
+
+    @property
+    def width(self) -> int:
+        """int: The frame width of the video in pixels."""
+        return int(self.video_capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+
+    @property
+    def height(self) -> int:
+        """int: The frame height of the video in pixels."""
+        return int(self.video_capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+    def release(self) -> None:
+        """Release the video capture handle."""
+        if self.video_capture is not None:
+            self.video_capture.release()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the video into a dictionary representation.
+
+        Returns:
+            Dict[str, Any]: The dictionary representation of the video.
+        """
+        return {
+            "name": self.name,
+            "source": self.source,
+            "backend": self.backend,
+            "hw_acceleration": self.hw_acceleration,
+        }
@@ -0,0 +1,3 @@
+"""Miscellaneous Utilities Subpackage"""
+
+from brain.util.misc.dtype import are_uuids, is_float, is_int
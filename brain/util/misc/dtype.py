@@ -0,0 +1,115 @@
+"""Data Type Utilities
+
+Predicates for validating scalar and container data types. They are used
+throughout the library to validate constructor arguments and property
+assignments.
+"""
+
+import functools
+import numbers
+import uuid
+from typing import Any
+
+import numpy as np
+
+# The accepted scalar types as frozensets for exact-type membership tests.
+_INT_TYPES = frozenset((int, np.intc, np.intp, np.int8, np.int16, np.int32, np.int64))
+_FLOAT_TYPES = frozenset((float, np.float16, np.float32, np.float64))
+
+
+@functools.lru_cache(maxsize=256)
+def _is_int_type(a_type: type) -> bool:
+    """Decide whether a class is an integer scalar type.
+
+    Keyed by the class rather than the value, so the decision — including
+    the slow :class:`numbers.Integral` ABC walk for exotic types — is paid
+    once per class and served from `lru_cache`'s C-level dict afterwards.
+
+    Args:
+        a_type (type): The class to be decided.
+
+    Returns:
+        bool: True if the class is an integer scalar type, False otherwise.
+    """
+    return issubclass(a_type, (int, np.integer)) or issubclass(a_type, numbers.Integral)
+
+
+@functools.lru_cache(maxsize=256)
+def _is_float_type(a_type: type) -> bool:
+    """Decide whether a class is a floating-point scalar type.
+
+    Keyed by the class rather than the value, so the decision — including
+    the slow :class:`numbers.Real` ABC walk for exotic types — is paid
+    once per class and served from `lru_cache`'s C-level dict afterwards.
+
+    Args:
+        a_type (type): The class to be decided.
+
+    Returns:
+        bool: True if the class is a floating-point scalar type, False
+            otherwise.
+    """
+    if issubclass(a_type, (float, np.floating)):
+        return True
+    return issubclass(a_type, numbers.Real) and not issubclass(a_type, (int, np.integer))
+
+
+def is_int(a_obj: Any) -> bool:
+    """Check whether an object is an integer scalar.
+
+    Both built-in `int` and the NumPy integer scalar types are accepted.
+    The common case is decided by an exact type-identity lookup with no
+    MRO traversal; exotic types fall back to the
+    :class:`numbers.Integral` ABC, with the per-type decision memoized.
+
+    Args:
+        a_obj (Any): The object to be checked.
+
+    Returns:
+        bool: True if `a_obj` is an integer scalar, False otherwise.
+    """
+    t = type(a_obj)
+    if t is int or t in _INT_TYPES:
+        return True
+    return _is_int_type(t)
+
+
+def is_float(a_obj: Any) -> bool:
+    """Check whether an object is a floating-point scalar.
+
+    Both built-in `float` and the NumPy floating scalar types are accepted.
+    The common case is decided by an exact type-identity lookup with no
+    MRO traversal; exotic types fall back to the :class:`numbers.Real`
+    ABC (excluding integral types), with the per-type decision memoized.
+
+    Args:
+        a_obj (Any): The object to be checked.
+
+    Returns:
+        bool: True if `a_obj` is a floating-point scalar, False otherwise.
+    """
+    t = type(a_obj)
+    if t is float or t in _FLOAT_TYPES:
+        return True
+    return _is_float_type(t)
+
+
+def are_uuids(a_obj: Any) -> bool:
+    """Check whether an object is a list or tuple of UUIDs.
+
+    The element scan is pushed into C through `all(map(...))` over the
+    bound instance check and exits on the first non-UUID element.
+
+    Args:
+        a_obj (Any): The object to be checked.
+
+    Returns:
+        bool: True if `a_obj` is a list or tuple whose elements are all
+            :class:`uuid.UUID` instances, False otherwise.
+    """
+    t = type(a_obj)
+    if t is not list and t is not tuple:
+        return False
+    # `map` feeds the bound C-level `__instancecheck__` directly, so the
+    # whole scan runs without per-element interpreter dispatch.
+    return all(map(uuid.UUID.__instancecheck__, a_obj))
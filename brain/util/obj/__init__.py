@@ -0,0 +1,5 @@
+"""Base Object Subpackage"""
+
+from brain.util.obj.obj import BaseObject
+from brain.util.obj.obj_dict import BaseObjectDict
+from brain.util.obj.obj_list import BaseObjectList
@@ -0,0 +1,121 @@
+"""Base Object Module
+
+This module defines :class:`BaseObject`, the common parent of the
+library's data objects. It provides a normalized name, dictionary
+serialization, string formatting, and copying.
+"""
+
+import pprint
+import sys
+from copy import deepcopy
+from typing import Any, Dict
+
+# Names are effectively constants, so the normalized (uppercased,
+# underscore-separated) form of each raw name is computed once and the
+# interned result is reused at dict-lookup speed.
+_NAME_CACHE: Dict[str, str] = {}
+
+
+class BaseObject:
+    """Base Object
+
+    The common parent class of the library's data objects.
+
+    Attributes:
+        name (str): The normalized (uppercased, underscore-separated) name
+            of the object.
+    """
+
+    __slots__ = ("_name",)
+
+    def __init__(self, a_name: str = "BASE_OBJECT") -> None:
+        """Constructor of the base object.
+
+        Args:
+            a_name (str, optional): The name of the object.
+                Defaults to `BASE_OBJECT`.
+        """
+        self.name = a_name
+
+    @property
+    def name(self) -> str:
+        """str: The normalized name of the object."""
+        return self._name
+
+    @name.setter
+    def name(self, a_name: str) -> None:
+        """Set and normalize the name of the object.
+
+        Args:
+            a_name (str): The name to be assigned.
+
+        Raises:
+            TypeError: If `a_name` is not a string.
+        """
+        if not isinstance(a_name, str):
+            raise TypeError(f"`a_name` must be a `str`, but it is given as `{type(a_name)}`.")
+        name = _NAME_CACHE.get(a_name)
+        if name is None:
+            name = sys.intern(a_name.upper().replace(" ", "_"))
+            _NAME_CACHE[a_name] = name
+        self._name = name
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the object into a dictionary representation.
+
+        Returns:
+            Dict[str, Any]: The dictionary representation of the object.
+
+        Raises:
+            NotImplementedError: If the subclass does not implement it.
+        """
+        raise NotImplementedError("Subclasses must implement `to_dict`.")
+
+    def pretty(self) -> str:
+        """Format the object into its full dictionary representation.
+
+        Returns:
+            str: The pretty-printed dictionary representation of the object.
+        """
+        return pprint.pformat(self.to_dict())
+
+    def to_str(self) -> str:
+        """Convert the object into a formatted string representation.
+
+        Returns:
+            str: The pretty-printed dictionary representation of the object.
+        """
+        return self.pretty()
+
+    def __repr__(self) -> str:
+        """Represent the object compactly.
+
+        The full field dump walks and formats every field through
+        `to_dict`, which is too expensive for log interpolation and
+        exception messages; use :meth:`pretty` for the full form.
+
+        Returns:
+            str: The compact string representation of the object.
+        """
+        return f"{type(self).__name__}(name={self._name!r})"
+
+    def _clone(self) -> "BaseObject":
+        """Clone the object.
+
+        The default implementation falls back to :func:`copy.deepcopy`.
+        Subclasses with flat, known fields can override this with an
+        explicit constructor call, which skips deepcopy's memo dict and
+        per-object `__reduce_ex__` dispatch.
+
+        Returns:
+            BaseObject: The cloned object.
+        """
+        return deepcopy(self)
+
+    def copy(self) -> "BaseObject":
+        """Create a copy of the object.
+
+        Returns:
+            BaseObject: The copied object.
+        """
+        return self._clone()
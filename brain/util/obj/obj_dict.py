@@ -0,0 +1,309 @@
+"""Base Object Dict Module
+
+This module defines :class:`BaseObjectDict`, a generic, optionally
+size-bounded dictionary of :class:`~brain.util.obj.obj.BaseObject` values.
+"""
+
+import pprint
+import sys
+from collections import OrderedDict
+from copy import deepcopy
+from types import MappingProxyType
+from typing import Dict, Generic, List, Mapping, Optional, TypeVar, Union
+
+T_key = TypeVar("T_key")
+T_value = TypeVar("T_value")
+
+# Normalized names, interned and keyed by the raw name. See
+# :mod:`brain.util.obj.obj` for the rationale.
+_NAME_CACHE: Dict[str, str] = {}
+
+# Resolved removal strategies. See :mod:`brain.util.obj.obj_list`; the
+# strategy string is parsed once per `append` call and the per-entry path
+# compares a small int.
+_EVICT_FIRST = 0
+_EVICT_LAST = 1
+
+
+def _resolve_strategy(a_removal_strategy: str) -> int:
+    """Resolve a removal strategy string into its eviction mode.
+
+    Args:
+        a_removal_strategy (str): The removal strategy (`first` or `last`).
+
+    Returns:
+        int: The resolved eviction mode.
+
+    Raises:
+        ValueError: If the removal strategy is not supported.
+    """
+    strategy = a_removal_strategy.lower()
+    if strategy == "first":
+        return _EVICT_FIRST
+    if strategy == "last":
+        return _EVICT_LAST
+    raise ValueError(f"Invalid removal strategy `{a_removal_strategy}`.")
+
+
+class BaseObjectDict(Generic[T_key, T_value]):
+    """Base Object Dict
+
+    A generic dictionary of data objects. When `a_max_size` is set, the
+    dictionary keeps at most that many entries and evicts according to a
+    removal strategy (`first` or `last`).
+
+    Attributes:
+        name (str): The normalized name of the dictionary.
+        items (Dict[T_key, T_value]): The underlying items of the dictionary.
+    """
+
+    __slots__ = ("_name", "_max_size", "_items")
+
+    def __init__(
+        self,
+        a_name: str = "BASE_OBJECT_DICT",
+        a_max_size: int = -1,
+        a_key: Optional[Union[T_key, List[T_key]]] = None,
+        a_value: Optional[Union[T_value, List[T_value]]] = None,
+    ) -> None:
+        """Constructor of the base object dictionary.
+
+        Args:
+            a_name (str, optional): The name of the dictionary.
+                Defaults to `BASE_OBJECT_DICT`.
+            a_max_size (int, optional): The maximum number of entries the
+                dictionary may hold, or -1 for an unbounded dictionary.
+                Defaults to -1.
+            a_key (Union[T_key, List[T_key]], optional): Initial key(s) to
+                populate the dictionary with. Defaults to None.
+            a_value (Union[T_value, List[T_value]], optional): Initial
+                value(s) matching `a_key`. Defaults to None.
+        """
+        self.name = a_name
+        self._max_size: int = int(a_max_size)
+        # An OrderedDict makes first-eviction a single C-level
+        # `popitem(last=False)` instead of an iterator probe plus pop.
+        self._items: "OrderedDict[T_key, T_value]" = OrderedDict()
+        if a_key is not None and a_value is not None:
+            self.append(a_key, a_value)
+
+    @property
+    def name(self) -> str:
+        """str: The normalized name of the dictionary."""
+        return self._name
+
+    @name.setter
+    def name(self, a_name: str) -> None:
+        """Set and normalize the name of the dictionary.
+
+        Args:
+            a_name (str): The name to be assigned.
+
+        Raises:
+            TypeError: If `a_name` is not a string.
+        """
+        if not isinstance(a_name, str):
+            raise TypeError(f"`a_name` must be a `str`, but it is given as `{type(a_name)}`.")
+        name = _NAME_CACHE.get(a_name)
+        if name is None:
+            name = sys.intern(a_name.upper().replace(" ", "_"))
+            _NAME_CACHE[a_name] = name
+        self._name = name
+
+    @property
+    def max_size(self) -> int:
+        """int: The maximum number of entries the dictionary may hold (-1 if unbounded)."""
+        return self._max_size
+
+    @property
+    def items(self) -> Dict[T_key, T_value]:
+        """Dict[T_key, T_value]: The underlying items of the dictionary."""
+        return self._items
+
+    def to_dict(self) -> Mapping[T_key, T_value]:
+        """Convert the dictionary into a plain mapping representation.
+
+        The returned mapping is a live read-only view of the underlying
+        items, so no copy is made; callers that need a mutable snapshot
+        can wrap it in `dict(...)`.
+
+        Returns:
+            Mapping[T_key, T_value]: The read-only view of the underlying
+                items.
+        """
+        return MappingProxyType(self._items)
+
+    def pretty(self) -> str:
+        """Format the dictionary into its full representation.
+
+        Returns:
+            str: The pretty-printed representation of the dictionary.
+        """
+        return pprint.pformat(self.to_dict())
+
+    def to_str(self) -> str:
+        """Convert the dictionary into a formatted string representation.
+
+        Returns:
+            str: The pretty-printed representation of the dictionary.
+        """
+        return self.pretty()
+
+    def __repr__(self) -> str:
+        """Represent the dictionary compactly.
+
+        Serializing every entry through `to_dict` is too expensive for
+        log interpolation; use :meth:`pretty` for the full form.
+
+        Returns:
+            str: The compact string representation of the dictionary.
+        """
+        return f"{type(self).__name__}(name={self._name!r}, n={len(self._items)})"
+
+    def __len__(self) -> int:
+        """Get the number of entries in the dictionary.
+
+        Returns:
+            int: The number of entries.
+        """
+        return len(self._items)
+
+    def __getitem__(self, a_key: T_key) -> T_value:
+        """Get the value associated with the given key.
+
+        Args:
+            a_key (T_key): The key to look up.
+
+        Returns:
+            T_value: The value associated with the key.
+        """
+        return self._items[a_key]
+
+    def __setitem__(self, a_key: T_key, a_value: T_value) -> None:
+        """Set the value associated with the given key.
+
+        Updates of existing keys are always in place; new keys go through
+        the bounded-append path when a maximum size is set. The membership
+        probe runs exactly once per assignment.
+
+        Args:
+            a_key (T_key): The key to be assigned.
+            a_value (T_value): The value to be assigned.
+        """
+        if self._max_size == -1 or a_key in self._items:
+            self._items[a_key] = a_value
+        else:
+            self._append_item(a_key, a_value, _EVICT_FIRST)
+
+    def __delitem__(self, a_key: T_key) -> None:
+        """Delete the entry associated with the given key.
+
+        Args:
+            a_key (T_key): The key to be deleted.
+        """
+        del self._items[a_key]
+
+    def __contains__(self, a_key: T_key) -> bool:
+        """Check whether a key is in the dictionary.
+
+        Args:
+            a_key (T_key): The key to look for.
+
+        Returns:
+            bool: True if the key is in the dictionary, False otherwise.
+        """
+        return a_key in self._items
+
+    def append(
+        self,
+        a_key: Union[T_key, List[T_key]],
+        a_value: Union[T_value, List[T_value]],
+        a_removal_strategy: str = "first",
+    ) -> None:
+        """Append entry(ies) to the dictionary.
+
+        Args:
+            a_key (Union[T_key, List[T_key]]): The key(s) to be appended.
+            a_value (Union[T_value, List[T_value]]): The value(s) matching
+                `a_key`.
+            a_removal_strategy (str, optional): The eviction strategy (`first`
+                or `last`) applied when the dictionary is full.
+                Defaults to `first`.
+
+        Raises:
+            ValueError: If key and value lists have different lengths, or if
+                the removal strategy is not supported.
+        """
+        evict_mode = _resolve_strategy(a_removal_strategy)
+        # Exact-type checks decide the common plain-list batch case with
+        # pointer compares instead of two isinstance MRO walks.
+        if type(a_key) is list and type(a_value) is list:
+            if len(a_key) != len(a_value):
+                raise ValueError(
+                    f"`a_key` and `a_value` must have the same length, "
+                    f"but they are given as `{len(a_key)}` and `{len(a_value)}`."
+                )
+            for key, value in zip(a_key, a_value):
+                self._append_item(key, value, evict_mode)
+        else:
+            self._append_item(a_key, a_value, evict_mode)
+
+    def _append_item(self, a_key: T_key, a_value: T_value, a_evict_mode: int = _EVICT_FIRST) -> None:
+        """Append a single entry, evicting if the dictionary is full.
+
+        Appending an existing key updates it in place and never evicts,
+        since the insert does not grow the dictionary.
+
+        Args:
+            a_key (T_key): The key to be appended.
+            a_value (T_value): The value to be appended.
+            a_evict_mode (int, optional): The resolved eviction mode applied
+                when the dictionary is full. Defaults to `_EVICT_FIRST`.
+        """
+        if self._max_size != -1 and len(self) >= self._max_size and a_key not in self._items:
+            self._items.popitem(last=a_evict_mode != _EVICT_FIRST)
+        self._items[a_key] = a_value
+
+    def pop(self, a_key: T_key) -> T_value:
+        """Remove and return the value associated with the given key.
+
+        Args:
+            a_key (T_key): The key to be removed.
+
+        Returns:
+            T_value: The removed value.
+        """
+        return self._items.pop(a_key)
+
+    def clear(self) -> None:
+        """Remove all entries from the dictionary in place.
+
+        Clearing in place reuses the backing allocation and keeps any
+        reference to the container held by external code valid.
+        """
+        self._items.clear()
+
+    def _clone(self) -> "BaseObjectDict[T_key, T_value]":
+        """Clone the dictionary through the typed constructor.
+
+        Each value is cloned through its own `_clone` when it has one,
+        falling back to :func:`copy.deepcopy` for foreign values. This
+        skips deepcopy's memo dict and per-entry `__reduce_ex__` dispatch.
+
+        Returns:
+            BaseObjectDict[T_key, T_value]: The cloned dictionary.
+        """
+        clone = type(self)(a_name=self._name, a_max_size=self._max_size)
+        clone._items.update(
+            (key, value._clone() if hasattr(value, "_clone") else deepcopy(value))
+            for key, value in self._items.items()
+        )
+        return clone
+
+    def copy(self) -> "BaseObjectDict[T_key, T_value]":
+        """Create a copy of the dictionary.
+
+        Returns:
+            BaseObjectDict[T_key, T_value]: The copied dictionary.
+        """
+        return self._clone()
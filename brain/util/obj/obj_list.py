@@ -0,0 +1,391 @@
+"""Base Object List Module
+
+This module defines :class:`BaseObjectList`, a generic, optionally
+size-bounded list of :class:`~brain.util.obj.obj.BaseObject` items.
+"""
+
+import pprint
+import sys
+from collections import deque
+from copy import deepcopy
+from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+# Normalized names, interned and keyed by the raw name. See
+# :mod:`brain.util.obj.obj` for the rationale.
+_NAME_CACHE: Dict[str, str] = {}
+
+# Resolved removal strategies. The strategy string is parsed once per
+# `append` call and the hot per-item path compares a small int instead of
+# lowercasing and comparing a string per insertion.
+_EVICT_FIRST = 0
+_EVICT_LAST = 1
+
+
+def _resolve_strategy(a_removal_strategy: str) -> int:
+    """Resolve a removal strategy string into its eviction mode.
+
+    Args:
+        a_removal_strategy (str): The removal strategy (`first` or `last`).
+
+    Returns:
+        int: The resolved eviction mode.
+
+    Raises:
+        ValueError: If the removal strategy is not supported.
+    """
+    strategy = a_removal_strategy.lower()
+    if strategy == "first":
+        return _EVICT_FIRST
+    if strategy == "last":
+        return _EVICT_LAST
+    raise ValueError(f"Invalid removal strategy `{a_removal_strategy}`.")
+
+
+class BaseObjectList(Generic[T]):
+    """Base Object List
+
+    A generic container of data objects. When `a_max_size` is set, the
+    list keeps at most that many items and evicts according to a removal
+    strategy (`first` or `last`).
+
+    Attributes:
+        name (str): The normalized name of the list.
+        items (List[T]): The underlying items of the list.
+        get (Callable[[int], T]): The bound indexer of the backing
+            container, for hot callers that index in a loop.
+    """
+
+    __slots__ = (
+        "_name",
+        "_max_size",
+        "_items",
+        "_count",
+        "_version",
+        "_dict_cache",
+        "_dict_version",
+        "get",
+    )
+
+    # Marker consulted by `append` to recognize container arguments with a
+    # single type-attribute lookup instead of an isinstance MRO walk
+    # against the dynamically resolved `self.__class__`.
+    _is_base_list = True
+
+    def __init__(
+        self,
+        a_name: str = "BASE_OBJECT_LIST",
+        a_max_size: int = -1,
+        a_items: Optional[Union[T, List[T], "BaseObjectList[T]"]] = None,
+    ) -> None:
+        """Constructor of the base object list.
+
+        Args:
+            a_name (str, optional): The name of the list.
+                Defaults to `BASE_OBJECT_LIST`.
+            a_max_size (int, optional): The maximum number of items the list
+                may hold, or -1 for an unbounded list. Defaults to -1.
+            a_items (Union[T, List[T], BaseObjectList[T]], optional): Initial
+                item(s) to populate the list with. Defaults to None.
+        """
+        self.name = a_name
+        self._max_size: int = int(a_max_size)
+        # A bounded list is a deque with `maxlen`, so eviction of the
+        # oldest item on append is O(1) instead of an O(n) `pop(0)` shift.
+        self._items: Union[List[T], deque] = deque(maxlen=a_max_size) if a_max_size > 0 else []
+        # Item count maintained by the mutators, so the hot insertion path
+        # reads an int instead of chaining len(self) -> __len__ -> len(items).
+        self._count: int = 0
+        # Mutation counter keying the `to_dict` cache; every mutating
+        # method bumps it so stale snapshots are never served.
+        self._version: int = 0
+        self._dict_cache: Optional[List[Dict[str, Any]]] = None
+        self._dict_version: int = -1
+        # Instance-bound C-level indexer for hot callers: `base_list.get(i)`
+        # jumps straight into the backing container's __getitem__ without a
+        # Python-level frame. Safe to bind once since `_items` is never
+        # replaced after construction (clear() mutates in place).
+        self.get = self._items.__getitem__
+        if a_items is not None:
+            self.append(a_items)
+
+    @property
+    def name(self) -> str:
+        """str: The normalized name of the list."""
+        return self._name
+
+    @name.setter
+    def name(self, a_name: str) -> None:
+        """Set and normalize the name of the list.
+
+        Args:
+            a_name (str): The name to be assigned.
+
+        Raises:
+            TypeError: If `a_name` is not a string.
+        """
+        if not isinstance(a_name, str):
+            raise TypeError(f"`a_name` must be a `str`, but it is given as `{type(a_name)}`.")
+        name = _NAME_CACHE.get(a_name)
+        if name is None:
+            name = sys.intern(a_name.upper().replace(" ", "_"))
+            _NAME_CACHE[a_name] = name
+        self._name = name
+
+    @property
+    def max_size(self) -> int:
+        """int: The maximum number of items the list may hold (-1 if unbounded)."""
+        return self._max_size
+
+    @property
+    def items(self) -> List[T]:
+        """List[T]: The underlying items of the list."""
+        return self._items
+
+    def to_dict(self) -> List[Dict[str, Any]]:
+        """Convert the items of the list into dictionary representations.
+
+        The result is rebuilt only when the list has mutated since the
+        last call and should be treated as a read-only snapshot.
+
+        Returns:
+            List[Dict[str, Any]]: The dictionary representations of the items.
+        """
+        if self._dict_version != self._version:
+            self._dict_cache = [item.to_dict() for item in self._items]
+            self._dict_version = self._version
+        return self._dict_cache
+
+    def pretty(self) -> str:
+        """Format the list into its full dictionary representation.
+
+        Returns:
+            str: The pretty-printed representation of the list.
+        """
+        return pprint.pformat(self.to_dict())
+
+    def to_str(self) -> str:
+        """Convert the list into a formatted string representation.
+
+        Returns:
+            str: The pretty-printed representation of the list.
+        """
+        return self.pretty()
+
+    def __repr__(self) -> str:
+        """Represent the list compactly.
+
+        Serializing every item through `to_dict` is too expensive for
+        log interpolation; use :meth:`pretty` for the full form.
+
+        Returns:
+            str: The compact string representation of the list.
+        """
+        return f"{type(self).__name__}(name={self._name!r}, n={len(self._items)})"
+
+    def __len__(self) -> int:
+        """Get the number of items in the list.
+
+        Returns:
+            int: The number of items.
+        """
+        return self._count
+
+    def __iter__(self):
+        """Iterate over the items of the list.
+
+        Exposes the backing container's native C-level iterator instead
+        of the `__getitem__`-based fallback protocol.
+
+        Returns:
+            Iterator[T]: The iterator over the items.
+        """
+        return iter(self._items)
+
+    def __getitem__(self, a_index: Union[int, slice]) -> Union[T, List[T]]:
+        """Get the item(s) at the given index or slice.
+
+        Args:
+            a_index (Union[int, slice]): The index or slice to look up.
+
+        Returns:
+            Union[T, List[T]]: The item(s) at the given position.
+        """
+        return self._items[a_index]
+
+    def __setitem__(self, a_index: int, a_item: T) -> None:
+        """Replace the item at the given index.
+
+        Args:
+            a_index (int): The index of the item to be replaced.
+            a_item (T): The item to be assigned.
+        """
+        self._items[a_index] = a_item
+        self._version += 1
+
+    def __delitem__(self, a_index: Union[int, slice]) -> None:
+        """Delete the item(s) at the given index or slice.
+
+        Args:
+            a_index (Union[int, slice]): The index or slice to be deleted.
+        """
+        del self._items[a_index]
+        self._count = len(self._items)
+        self._version += 1
+
+    def __contains__(self, a_item: T) -> bool:
+        """Check whether an item is in the list.
+
+        Args:
+            a_item (T): The item to look for.
+
+        Returns:
+            bool: True if the item is in the list, False otherwise.
+        """
+        return a_item in self._items
+
+    def contains_id(self, a_item: T) -> bool:
+        """Check whether an item is in the list by identity.
+
+        Unlike `in`, which falls back to the items' potentially expensive
+        `__eq__`, this scans with identity compares only. It is the right
+        membership test when instances are shared by reference.
+
+        Args:
+            a_item (T): The item to look for.
+
+        Returns:
+            bool: True if the exact instance is in the list, False otherwise.
+        """
+        for item in self._items:
+            if item is a_item:
+                return True
+        return False
+
+    def append(
+        self,
+        a_item: Union[T, List[T], "BaseObjectList[T]"],
+        a_removal_strategy: str = "first",
+    ) -> None:
+        """Append item(s) to the list.
+
+        Batches extend the backing container in one call for the
+        unbounded and `first` cases, where the deque's `maxlen` discards
+        the oldest overflow natively. Bounded `last` batches take the
+        per-item path, which is the only way to keep batch appends
+        equivalent to appending the same items one by one (each append
+        evicts the then-newest item). The strategy string is resolved
+        once per call in either case.
+
+        Args:
+            a_item (Union[T, List[T], BaseObjectList[T]]): The item(s) to be
+                appended. Lists, tuples, and BaseObjectList containers are
+                treated as batches.
+            a_removal_strategy (str, optional): The eviction strategy (`first`
+                or `last`) applied when the list is full. Defaults to `first`.
+
+        Raises:
+            ValueError: If the removal strategy is not supported.
+        """
+        evict_mode = _resolve_strategy(a_removal_strategy)
+        self._version += 1
+        # Exact-type checks decide the common plain-list (and tuple) batch
+        # case with pointer compares; container arguments are recognized by
+        # the `_is_base_list` marker rather than an isinstance MRO walk.
+        t = type(a_item)
+        if t is list or t is tuple:
+            incoming = a_item
+        elif getattr(t, "_is_base_list", False):
+            incoming = a_item._items
+        else:
+            self._append_item(a_item, evict_mode)
+            return
+        if self._max_size > 0 and evict_mode == _EVICT_LAST:
+            append_item = self._append_item
+            for item in incoming:
+                append_item(item, _EVICT_LAST)
+            return
+        self._items.extend(incoming)
+        self._count = len(self._items)
+
+    def _append_item(self, a_item: T, a_evict_mode: int = _EVICT_FIRST) -> None:
+        """Append a single item, evicting if the list is full.
+
+        Args:
+            a_item (T): The item to be appended.
+            a_evict_mode (int, optional): The resolved eviction mode applied
+                when the list is full. Defaults to `_EVICT_FIRST`.
+        """
+        if self._max_size != -1 and self._count >= self._max_size:
+            if a_evict_mode == _EVICT_LAST:
+                self._items.pop()
+            # With `_EVICT_FIRST` the deque's `maxlen` evicts the oldest
+            # item on append; either way the count stays at the bound.
+            self._items.append(a_item)
+        else:
+            self._items.append(a_item)
+            self._count += 1
+
+    def pop(self, a_index: int = -1) -> T:
+        """Remove and return the item at the given index.
+
+        Args:
+            a_index (int, optional): The index of the item to be removed.
+                Defaults to -1.
+
+        Returns:
+            T: The removed item.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        # The bookkeeping runs only after the underlying pop succeeded; a
+        # failed pop must leave the counters untouched.
+        if type(self._items) is list:
+            item = self._items.pop(a_index)
+        elif a_index == -1:
+            item = self._items.pop()
+        elif a_index == 0:
+            item = self._items.popleft()
+        else:
+            item = self._items[a_index]
+            del self._items[a_index]
+        self._count -= 1
+        self._version += 1
+        return item
+
+    def clear(self) -> None:
+        """Remove all items from the list in place.
+
+        Clearing in place reuses the backing allocation and keeps any
+        reference to the container held by external code valid.
+        """
+        self._items.clear()
+        self._count = 0
+        self._version += 1
+
+    def _clone(self) -> "BaseObjectList[T]":
+        """Clone the list through the typed constructor.
+
+        Each item is cloned through its own `_clone` when it has one,
+        falling back to :func:`copy.deepcopy` for foreign items. This
+        skips deepcopy's memo dict and per-item `__reduce_ex__` dispatch.
+
+        Returns:
+            BaseObjectList[T]: The cloned list.
+        """
+        clone = type(self)(a_name=self._name, a_max_size=self._max_size)
+        clone._items.extend(
+            item._clone() if hasattr(item, "_clone") else deepcopy(item) for item in self._items
+        )
+        clone._count = len(clone._items)
+        return clone
+
+    def copy(self) -> "BaseObjectList[T]":
+        """Create a copy of the list.
+
+        Returns:
+            BaseObjectList[T]: The copied list.
+        """
+        return self._clone()
@@ -0,0 +1,297 @@
+"""Tests for the cnt containers (:mod:`brain.util.cnt`)."""
+
+import json
+import unittest
+
+from brain.util.cnt.b_dict import BaseDict
+from brain.util.cnt.b_list import BaseList
+
+
+class TestBaseListEviction(unittest.TestCase):
+    """Eviction strategies of :class:`BaseList`."""
+
+    def test_unbounded_append_keeps_everything(self):
+        base_list = BaseList(a_items=[1, 2, 3])
+        base_list.append(4)
+        self.assertEqual(list(base_list), [1, 2, 3, 4])
+
+    def test_first_strategy_evicts_oldest(self):
+        base_list = BaseList(a_max_size=3, a_items=[1, 2, 3])
+        base_list.append(4)
+        self.assertEqual(list(base_list), [2, 3, 4])
+
+    def test_last_strategy_evicts_newest(self):
+        base_list = BaseList(a_max_size=3, a_removal_strategy="last", a_items=[1, 2, 3])
+        base_list.append(4)
+        self.assertEqual(list(base_list), [1, 2, 4])
+
+    def test_invalid_strategy_raises(self):
+        with self.assertRaises(ValueError):
+            BaseList(a_removal_strategy="bogus")
+
+
+class TestBaseListBulkAppend(unittest.TestCase):
+    """Bulk-append paths of :class:`BaseList`."""
+
+    def test_unbounded_extend(self):
+        base_list = BaseList()
+        base_list.extend([1, 2])
+        base_list.extend([3])
+        self.assertEqual(list(base_list), [1, 2, 3])
+
+    def test_bounded_first_extend_overflow(self):
+        base_list = BaseList(a_max_size=3)
+        base_list.extend([1, 2, 3, 4, 5])
+        self.assertEqual(list(base_list), [3, 4, 5])
+
+    def test_bounded_last_extend_overflow(self):
+        base_list = BaseList(a_max_size=3, a_removal_strategy="last")
+        base_list.extend([1, 2, 3, 4, 5])
+        self.assertEqual(list(base_list), [1, 2, 5])
+
+    def test_append_dispatches_batches(self):
+        base_list = BaseList()
+        base_list.append([1, 2])
+        base_list.append(BaseList(a_items=[3, 4]))
+        base_list.append(5)
+        self.assertEqual(list(base_list), [1, 2, 3, 4, 5])
+
+
+class TestBaseListBehavior(unittest.TestCase):
+    """General behavior of :class:`BaseList`."""
+
+    def test_name_is_normalized_and_shared(self):
+        first = BaseList(a_name="my list")
+        second = BaseList(a_name="my list")
+        self.assertEqual(first.name, "MY_LIST")
+        self.assertIs(first.name, second.name)
+
+    def test_rename(self):
+        base_list = BaseList()
+        base_list.rename("other name")
+        self.assertEqual(base_list.name, "OTHER_NAME")
+        with self.assertRaises(TypeError):
+            base_list.rename(3)
+
+    def test_clear_keeps_backing_container(self):
+        base_list = BaseList(a_max_size=3, a_items=[1, 2, 3])
+        backing = base_list.items
+        base_list.clear()
+        self.assertIs(base_list.items, backing)
+        self.assertEqual(len(base_list), 0)
+        base_list.extend([7, 8, 9, 10])
+        self.assertEqual(list(base_list), [8, 9, 10])
+
+    def test_clear_keeps_last_eviction_bound(self):
+        base_list = BaseList(a_max_size=2, a_removal_strategy="last", a_items=[1, 2])
+        base_list.clear()
+        base_list.extend([5, 6])
+        base_list.append(7)
+        self.assertEqual(list(base_list), [5, 7])
+
+    def test_pop(self):
+        bounded = BaseList(a_max_size=4, a_items=[1, 2, 3])
+        self.assertEqual(bounded.pop(), 3)
+        self.assertEqual(bounded.pop(0), 1)
+        unbounded = BaseList(a_items=[1, 2, 3])
+        self.assertEqual(unbounded.pop(1), 2)
+
+    def test_to_dict_primitive_short_circuit(self):
+        base_list = BaseList(a_items=[1, 2, 3])
+        self.assertEqual(base_list.to_dict(), [1, 2, 3])
+
+    def test_to_dict_objects(self):
+        class Item:
+            def __init__(self, a_value):
+                self.value = a_value
+
+            def to_dict(self):
+                return {"value": self.value}
+
+        base_list = BaseList(a_items=[Item(1), Item(2)])
+        self.assertEqual(base_list.to_dict(), [{"value": 1}, {"value": 2}])
+
+
+class TestBaseListCopy(unittest.TestCase):
+    """Copy semantics of :class:`BaseList`."""
+
+    def test_shallow_copy_shares_items(self):
+        shared = [1]
+        base_list = BaseList(a_max_size=3, a_items=[shared])
+        clone = base_list.copy()
+        self.assertIsNot(clone, base_list)
+        self.assertIs(clone[0], shared)
+        self.assertEqual(clone.name, base_list.name)
+        self.assertEqual(clone.max_size, base_list.max_size)
+
+    def test_copy_is_independent(self):
+        base_list = BaseList(a_max_size=2, a_items=[1, 2])
+        clone = base_list.copy()
+        clone.append(3)
+        self.assertEqual(list(base_list), [1, 2])
+        self.assertEqual(list(clone), [2, 3])
+
+    def test_deep_copy_copies_items(self):
+        class Item:
+            def __init__(self, a_value):
+                self.value = a_value
+
+            def copy(self):
+                return Item(self.value)
+
+        base_list = BaseList(a_items=[Item(1)])
+        clone = base_list.copy(a_deep=True)
+        self.assertIsNot(clone[0], base_list[0])
+        self.assertEqual(clone[0].value, 1)
+
+
+class TestBaseDictEviction(unittest.TestCase):
+    """Eviction strategies of :class:`BaseDict`."""
+
+    def test_first_strategy_evicts_oldest(self):
+        base_dict = BaseDict(a_max_size=2)
+        base_dict["a"] = 1
+        base_dict["b"] = 2
+        base_dict["c"] = 3
+        self.assertEqual(dict(base_dict), {"b": 2, "c": 3})
+
+    def test_last_strategy_evicts_newest(self):
+        base_dict = BaseDict(a_max_size=2, a_removal_strategy="last")
+        base_dict.append(["a", "b", "c"], [1, 2, 3])
+        self.assertEqual(dict(base_dict), {"a": 1, "c": 3})
+
+    def test_existing_key_update_never_evicts(self):
+        base_dict = BaseDict(a_max_size=2)
+        base_dict["a"] = 1
+        base_dict["b"] = 2
+        base_dict["a"] = 10
+        self.assertEqual(dict(base_dict), {"a": 10, "b": 2})
+
+    def test_lru_read_refreshes_entry(self):
+        base_dict = BaseDict(a_max_size=3, a_removal_strategy="lru")
+        base_dict["a"] = 1
+        base_dict["b"] = 2
+        base_dict["c"] = 3
+        _ = base_dict["a"]
+        base_dict["d"] = 4
+        self.assertNotIn("b", base_dict)
+        self.assertIn("a", base_dict)
+
+    def test_lru_write_refreshes_entry(self):
+        base_dict = BaseDict(a_max_size=3, a_removal_strategy="lru")
+        base_dict["a"] = 1
+        base_dict["b"] = 2
+        base_dict["c"] = 3
+        base_dict["a"] = 10
+        base_dict["d"] = 4
+        self.assertNotIn("b", base_dict)
+        self.assertEqual(base_dict["a"], 10)
+
+    def test_invalid_strategy_raises(self):
+        with self.assertRaises(ValueError):
+            BaseDict(a_removal_strategy="bogus")
+
+
+class TestBaseDictBulkAppend(unittest.TestCase):
+    """Bulk-append paths of :class:`BaseDict`."""
+
+    def test_unbounded_extend_pairs(self):
+        base_dict = BaseDict()
+        base_dict.extend_pairs(["a", "b"], [1, 2])
+        self.assertEqual(dict(base_dict), {"a": 1, "b": 2})
+
+    def test_bounded_extend_pairs_evicts(self):
+        base_dict = BaseDict(a_max_size=2)
+        base_dict.extend_pairs(["a", "b", "c"], [1, 2, 3])
+        self.assertEqual(dict(base_dict), {"b": 2, "c": 3})
+
+    def test_constructor_bulk_init(self):
+        base_dict = BaseDict(a_key=["x", "y"], a_value=[1, 2])
+        self.assertEqual(dict(base_dict), {"x": 1, "y": 2})
+
+    def test_length_mismatch_raises(self):
+        base_dict = BaseDict()
+        with self.assertRaises(ValueError):
+            base_dict.extend_pairs(["a"], [1, 2])
+        with self.assertRaises(ValueError):
+            BaseDict(a_key=["a"], a_value=[1, 2])
+
+
+class TestBaseDictBehavior(unittest.TestCase):
+    """General behavior of :class:`BaseDict`."""
+
+    def test_mapping_protocol_is_native(self):
+        base_dict = BaseDict(a_key=["a", "b"], a_value=[1, 2])
+        self.assertIsInstance(base_dict, dict)
+        self.assertEqual(list(base_dict.items()), [("a", 1), ("b", 2)])
+        self.assertEqual(list(base_dict.keys()), ["a", "b"])
+        self.assertEqual(list(base_dict.values()), [1, 2])
+        self.assertEqual(json.dumps(base_dict), '{"a": 1, "b": 2}')
+
+    def test_delete_and_contains(self):
+        base_dict = BaseDict(a_key=["a", "b"], a_value=[1, 2])
+        del base_dict["a"]
+        self.assertNotIn("a", base_dict)
+        self.assertIn("b", base_dict)
+        self.assertEqual(len(base_dict), 1)
+
+    def test_pop_and_clear(self):
+        base_dict = BaseDict(a_key=["a", "b"], a_value=[1, 2])
+        self.assertEqual(base_dict.pop("a"), 1)
+        base_dict.clear()
+        self.assertEqual(len(base_dict), 0)
+        base_dict["k"] = 9
+        self.assertEqual(dict(base_dict), {"k": 9})
+
+    def test_to_dict_and_to_str(self):
+        base_dict = BaseDict(a_key=["a"], a_value=[1])
+        self.assertEqual(base_dict.to_dict(), {"a": 1})
+        self.assertEqual(base_dict.to_str(), "{'a': 1}")
+        self.assertEqual(repr(base_dict), "{'a': 1}")
+
+
+class TestBaseDictCopy(unittest.TestCase):
+    """Copy semantics of :class:`BaseDict`."""
+
+    def test_shallow_copy_shares_values(self):
+        shared = [1]
+        base_dict = BaseDict(a_key=["a"], a_value=[shared])
+        clone = base_dict.copy()
+        self.assertIsNot(clone, base_dict)
+        self.assertIs(clone["a"], shared)
+        self.assertEqual(clone.name, base_dict.name)
+
+    def test_copy_is_independent(self):
+        base_dict = BaseDict(a_max_size=2, a_key=["a", "b"], a_value=[1, 2])
+        clone = base_dict.copy()
+        clone["c"] = 3
+        self.assertEqual(dict(base_dict), {"a": 1, "b": 2})
+        self.assertEqual(dict(clone), {"b": 2, "c": 3})
+
+    def test_deep_copy_copies_values(self):
+        class Value:
+            def __init__(self, a_value):
+                self.value = a_value
+
+            def copy(self):
+                return Value(self.value)
+
+        base_dict = BaseDict(a_key=["a"], a_value=[Value(1)])
+        clone = base_dict.copy(a_deep=True)
+        self.assertIsNot(clone["a"], base_dict["a"])
+        self.assertEqual(clone["a"].value, 1)
+
+    def test_lru_copy_keeps_semantics_and_source_order(self):
+        base_dict = BaseDict(a_max_size=3, a_removal_strategy="lru")
+        base_dict.append(["a", "b", "c"], [1, 2, 3])
+        order = list(base_dict)
+        clone = base_dict.copy()
+        self.assertEqual(list(base_dict), order)
+        _ = clone["a"]
+        clone["d"] = 4
+        self.assertNotIn("b", clone)
+        self.assertIn("a", clone)
+
+
+if __name__ == "__main__":
+    unittest.main()
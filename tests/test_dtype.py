@@ -0,0 +1,70 @@
+"""Tests for the data type predicates (:mod:`brain.util.misc.dtype`)."""
+
+import unittest
+import uuid
+from fractions import Fraction
+
+import numpy as np
+
+from brain.util.misc.dtype import are_uuids, is_float, is_int
+
+
+class TestIsInt(unittest.TestCase):
+    """Behavior of :func:`is_int`."""
+
+    def test_builtin_int(self):
+        self.assertTrue(is_int(3))
+        self.assertTrue(is_int(-1))
+
+    def test_numpy_integers(self):
+        for dtype in (np.int8, np.int16, np.int32, np.int64, np.uint8):
+            self.assertTrue(is_int(dtype(3)), dtype)
+
+    def test_non_integers(self):
+        self.assertFalse(is_int(3.0))
+        self.assertFalse(is_int(np.float32(3.0)))
+        self.assertFalse(is_int("3"))
+        self.assertFalse(is_int(None))
+
+
+class TestIsFloat(unittest.TestCase):
+    """Behavior of :func:`is_float`."""
+
+    def test_builtin_float(self):
+        self.assertTrue(is_float(3.0))
+        self.assertTrue(is_float(-0.5))
+
+    def test_numpy_floats(self):
+        for dtype in (np.float16, np.float32, np.float64):
+            self.assertTrue(is_float(dtype(3.0)), dtype)
+
+    def test_real_abc_fallback_excludes_integrals(self):
+        self.assertTrue(is_float(Fraction(1, 2)))
+        self.assertFalse(is_float(3))
+        self.assertFalse(is_float(np.int32(3)))
+
+    def test_non_floats(self):
+        self.assertFalse(is_float("3.0"))
+        self.assertFalse(is_float(None))
+
+
+class TestAreUuids(unittest.TestCase):
+    """Behavior of :func:`are_uuids`."""
+
+    def test_list_and_tuple_of_uuids(self):
+        ids = [uuid.uuid4(), uuid.uuid4()]
+        self.assertTrue(are_uuids(ids))
+        self.assertTrue(are_uuids(tuple(ids)))
+        self.assertTrue(are_uuids([]))
+
+    def test_mixed_elements(self):
+        self.assertFalse(are_uuids([uuid.uuid4(), "not-a-uuid"]))
+
+    def test_non_containers(self):
+        self.assertFalse(are_uuids(uuid.uuid4()))
+        self.assertFalse(are_uuids(str(uuid.uuid4())))
+        self.assertFalse(are_uuids(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""Tests for the image classes (:mod:`brain.util.cv.img`)."""
+
+import unittest
+
+import numpy as np
+
+from brain.util.cv.img.frm import Frame2D, Frame2DList
+from brain.util.cv.img.img import Image2D
+
+
+class TestImage2DGeometry(unittest.TestCase):
+    """Cached geometry of :class:`Image2D`."""
+
+    def test_color_image_geometry(self):
+        image = Image2D(np.zeros((48, 64, 3), dtype=np.uint8))
+        self.assertEqual(image.width, 64)
+        self.assertEqual(image.height, 48)
+        self.assertEqual(image.channels, 3)
+
+    def test_grayscale_image_geometry(self):
+        image = Image2D(np.zeros((48, 64), dtype=np.uint8))
+        self.assertEqual(image.channels, 1)
+
+    def test_size_is_cached_per_data_assignment(self):
+        image = Image2D(np.zeros((48, 64, 3), dtype=np.uint8))
+        first = image.size
+        self.assertIs(image.size, first)
+        self.assertEqual((first.width, first.height), (64, 48))
+        image.data = np.zeros((10, 20, 3), dtype=np.uint8)
+        second = image.size
+        self.assertIsNot(second, first)
+        self.assertEqual((second.width, second.height), (20, 10))
+
+    def test_geometry_recomputed_on_reassignment(self):
+        image = Image2D(np.zeros((48, 64, 3), dtype=np.uint8))
+        image.data = np.zeros((8, 16), dtype=np.uint8)
+        self.assertEqual((image.width, image.height, image.channels), (16, 8, 1))
+
+    def test_invalid_data_raises(self):
+        with self.assertRaises(TypeError):
+            Image2D([[0, 1], [2, 3]])
+        with self.assertRaises(ValueError):
+            Image2D(np.zeros((2, 2, 2, 2), dtype=np.uint8))
+
+    def test_unchecked_matches_validated_construction(self):
+        data = np.zeros((4, 6, 3), dtype=np.uint8)
+        image = Image2D._unchecked(a_data=data, a_name="IMAGE2D")
+        self.assertIs(image.data, data)
+        self.assertEqual((image.width, image.height, image.channels), (6, 4, 3))
+        self.assertIsNone(image.filename)
+
+
+class TestFrame2D(unittest.TestCase):
+    """Behavior of :class:`Frame2D`."""
+
+    def test_sequence_id(self):
+        frame = Frame2D(np.zeros((4, 4), dtype=np.uint8), a_sequence_id=7)
+        self.assertEqual(frame.sequence_id, 7)
+        with self.assertRaises(TypeError):
+            frame.sequence_id = "7"
+
+    def test_to_dict_includes_sequence_id(self):
+        frame = Frame2D(np.zeros((4, 4), dtype=np.uint8), a_sequence_id=3)
+        self.assertEqual(frame.to_dict()["sequence_id"], 3)
+
+    def test_unchecked_sets_sequence_id(self):
+        frame = Frame2D._unchecked(np.zeros((4, 4), dtype=np.uint8), a_sequence_id=5)
+        self.assertEqual(frame.sequence_id, 5)
+
+
+class TestFrame2DList(unittest.TestCase):
+    """Behavior of :class:`Frame2DList`."""
+
+    def test_bounded_cache_evicts_oldest_frame(self):
+        frames = Frame2DList(a_max_size=2)
+        for i in range(3):
+            frames.append(Frame2D(np.zeros((4, 4), dtype=np.uint8), a_sequence_id=i))
+        self.assertEqual(len(frames), 2)
+        self.assertEqual(frames[0].sequence_id, 1)
+        self.assertEqual(frames[-1].sequence_id, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+"""Tests for the obj containers (:mod:`brain.util.obj`)."""
+
+import unittest
+from typing import Any, Dict
+
+from brain.util.obj.obj import BaseObject
+from brain.util.obj.obj_dict import BaseObjectDict
+from brain.util.obj.obj_list import BaseObjectList
+
+
+class _Item(BaseObject):
+    """A minimal data object for exercising the containers."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, a_value: int, a_name: str = "ITEM") -> None:
+        super().__init__(a_name=a_name)
+        self.value = a_value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "value": self.value}
+
+    def _clone(self) -> "_Item":
+        return _Item(a_value=self.value, a_name=self.name)
+
+
+class TestBaseObject(unittest.TestCase):
+    """Behavior of :class:`BaseObject`."""
+
+    def test_name_is_normalized_and_shared(self):
+        first = _Item(1, a_name="my item")
+        second = _Item(2, a_name="my item")
+        self.assertEqual(first.name, "MY_ITEM")
+        self.assertIs(first.name, second.name)
+
+    def test_to_dict_is_abstract(self):
+        with self.assertRaises(NotImplementedError):
+            BaseObject().to_dict()
+
+    def test_copy(self):
+        item = _Item(7)
+        clone = item.copy()
+        self.assertIsNot(clone, item)
+        self.assertEqual(clone.value, 7)
+
+
+class TestBaseObjectListEviction(unittest.TestCase):
+    """Eviction strategies of :class:`BaseObjectList`."""
+
+    def test_first_strategy_evicts_oldest(self):
+        object_list = BaseObjectList(a_max_size=2, a_items=[_Item(1), _Item(2)])
+        object_list.append(_Item(3))
+        self.assertEqual([item.value for item in object_list], [2, 3])
+
+    def test_last_strategy_evicts_newest(self):
+        object_list = BaseObjectList(a_max_size=2, a_items=[_Item(1), _Item(2)])
+        object_list.append(_Item(3), a_removal_strategy="last")
+        self.assertEqual([item.value for item in object_list], [1, 3])
+
+    def test_bulk_append_overflow(self):
+        object_list = BaseObjectList(a_max_size=3)
+        object_list.append([_Item(i) for i in range(5)])
+        self.assertEqual([item.value for item in object_list], [2, 3, 4])
+        self.assertEqual(len(object_list), 3)
+
+    def test_invalid_strategy_raises(self):
+        object_list = BaseObjectList(a_max_size=2)
+        with self.assertRaises(ValueError):
+            object_list.append(_Item(1), a_removal_strategy="bogus")
+
+
+class TestBaseObjectListBehavior(unittest.TestCase):
+    """General behavior of :class:`BaseObjectList`."""
+
+    def test_to_dict_cache_invalidates_on_mutation(self):
+        object_list = BaseObjectList(a_items=[_Item(1)])
+        first = object_list.to_dict()
+        self.assertIs(object_list.to_dict(), first)
+        object_list.append(_Item(2))
+        second = object_list.to_dict()
+        self.assertIsNot(second, first)
+        self.assertEqual([entry["value"] for entry in second], [1, 2])
+
+    def test_contains_id_checks_identity(self):
+        item = _Item(1)
+        object_list = BaseObjectList(a_items=[item])
+        self.assertTrue(object_list.contains_id(item))
+        self.assertFalse(object_list.contains_id(_Item(1)))
+
+    def test_len_tracks_mutations(self):
+        object_list = BaseObjectList(a_max_size=2)
+        object_list.append([_Item(1), _Item(2), _Item(3)])
+        self.assertEqual(len(object_list), 2)
+        object_list.pop()
+        self.assertEqual(len(object_list), 1)
+        object_list.clear()
+        self.assertEqual(len(object_list), 0)
+
+    def test_clone_is_deep(self):
+        object_list = BaseObjectList(a_max_size=3, a_items=[_Item(1), _Item(2)])
+        clone = object_list.copy()
+        self.assertEqual(len(clone), 2)
+        self.assertIsNot(clone[0], object_list[0])
+        self.assertEqual(clone[0].value, 1)
+        clone.append(_Item(3))
+        self.assertEqual(len(object_list), 2)
+
+
+class TestBaseObjectDict(unittest.TestCase):
+    """Behavior of :class:`BaseObjectDict`."""
+
+    def test_first_strategy_evicts_oldest(self):
+        object_dict = BaseObjectDict(a_max_size=2)
+        object_dict.append(["a", "b", "c"], [_Item(1), _Item(2), _Item(3)])
+        self.assertNotIn("a", object_dict)
+        self.assertEqual(object_dict["c"].value, 3)
+
+    def test_last_strategy_evicts_newest(self):
+        object_dict = BaseObjectDict(a_max_size=2)
+        object_dict.append(["a", "b"], [_Item(1), _Item(2)])
+        object_dict.append("c", _Item(3), a_removal_strategy="last")
+        self.assertNotIn("b", object_dict)
+        self.assertIn("a", object_dict)
+
+    def test_setitem_updates_in_place(self):
+        object_dict = BaseObjectDict(a_max_size=2)
+        object_dict.append(["a", "b"], [_Item(1), _Item(2)])
+        object_dict["a"] = _Item(10)
+        self.assertEqual(object_dict["a"].value, 10)
+        self.assertEqual(len(object_dict), 2)
+
+    def test_length_mismatch_raises(self):
+        object_dict = BaseObjectDict()
+        with self.assertRaises(ValueError):
+            object_dict.append(["a"], [_Item(1), _Item(2)])
+
+    def test_clone_is_deep(self):
+        object_dict = BaseObjectDict(a_max_size=2)
+        object_dict.append(["a"], [_Item(1)])
+        clone = object_dict.copy()
+        self.assertIsNot(clone["a"], object_dict["a"])
+        self.assertEqual(clone["a"].value, 1)
+        clone["b"] = _Item(2)
+        self.assertNotIn("b", object_dict)
+
+
+if __name__ == "__main__":
+    unittest.main()
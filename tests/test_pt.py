@@ -0,0 +1,200 @@
+"""Tests for the point containers (:mod:`brain.util.cv.shape.pt`)."""
+
+import math
+import unittest
+
+import numpy as np
+
+from brain.util.cv.shape.pt._fast import _speeds_batch_np, _speeds_batch_py, speeds_batch
+from brain.util.cv.shape.pt.key_point import KeyPoint2D, KeyPoint2DList
+from brain.util.cv.shape.pt.point import Point2D, Point2DList
+
+
+class TestPoint2D(unittest.TestCase):
+    """Behavior of :class:`Point2D`."""
+
+    def test_coordinates_and_conversions(self):
+        point = Point2D(1, 2.5)
+        self.assertEqual(point.x, 1)
+        self.assertEqual(point.y, 2.5)
+        self.assertEqual(point.to_tuple(), (1, 2.5))
+        np.testing.assert_array_equal(point.to_numpy(), [1, 2.5])
+
+    def test_numpy_scalars_are_converted(self):
+        point = Point2D(np.int32(1), np.float32(2.0))
+        self.assertIsInstance(point.x, int)
+        self.assertIsInstance(point.y, float)
+
+    def test_non_numeric_raises(self):
+        with self.assertRaises(TypeError):
+            Point2D("1", 2)
+
+    def test_equality(self):
+        self.assertEqual(Point2D(1, 2), Point2D(1.0, 2.0))
+        self.assertNotEqual(Point2D(1, 2), Point2D(1, 3))
+
+    def test_speed_is_normalized(self):
+        dy, dx = Point2D(0, 0).speed(Point2D(3, 4))
+        self.assertAlmostEqual(math.hypot(dx, dy), 1.0, places=6)
+        self.assertAlmostEqual(dx, 0.6, places=6)
+        self.assertAlmostEqual(dy, 0.8, places=6)
+
+
+class TestPoint2DListAppendRows(unittest.TestCase):
+    """Bounded eviction of :meth:`Point2DList._append_rows`."""
+
+    def test_unbounded_growth(self):
+        point_list = Point2DList()
+        point_list.append(np.arange(10, dtype=np.float32).reshape(5, 2))
+        self.assertEqual(len(point_list), 5)
+        np.testing.assert_array_equal(point_list.ndarray[0], [0, 1])
+
+    def test_partial_overflow_drops_oldest(self):
+        point_list = Point2DList(a_max_size=3)
+        point_list.append(np.asarray([[1, 1], [2, 2], [3, 3]], dtype=np.float32))
+        point_list.append(np.asarray([[4, 4], [5, 5]], dtype=np.float32))
+        self.assertEqual(len(point_list), 3)
+        np.testing.assert_array_equal(point_list.ndarray[:, 0], [3, 4, 5])
+
+    def test_batch_larger_than_bound_keeps_newest(self):
+        point_list = Point2DList(a_max_size=3)
+        point_list.append(np.asarray([[i, i] for i in range(1, 6)], dtype=np.float32))
+        self.assertEqual(len(point_list), 3)
+        np.testing.assert_array_equal(point_list.ndarray[:, 0], [3, 4, 5])
+
+    def test_eviction_matches_sequential_appends(self):
+        batched = Point2DList(a_max_size=4)
+        sequential = Point2DList(a_max_size=4)
+        rows = np.asarray([[i, -i] for i in range(7)], dtype=np.float32)
+        batched.append(rows)
+        for row in rows:
+            sequential.append(row.reshape(1, 2))
+        np.testing.assert_array_equal(batched.ndarray, sequential.ndarray)
+
+    def test_clear_keeps_storage_and_resets_length(self):
+        point_list = Point2DList(a_max_size=3)
+        point_list.append(np.asarray([[1, 1], [2, 2]], dtype=np.float32))
+        point_list.clear()
+        self.assertEqual(len(point_list), 0)
+        point_list.append(np.asarray([[9, 9]], dtype=np.float32))
+        np.testing.assert_array_equal(point_list.ndarray, [[9, 9]])
+
+
+class TestPoint2DListBehavior(unittest.TestCase):
+    """General behavior of :class:`Point2DList`."""
+
+    def test_lazy_items_and_indexing(self):
+        point_list = Point2DList(a_items=[Point2D(1, 2), Point2D(3, 4)])
+        self.assertIsInstance(point_list[0], Point2D)
+        self.assertEqual(point_list[1].to_tuple(), (3.0, 4.0))
+        self.assertEqual([p.to_tuple() for p in point_list], [(1.0, 2.0), (3.0, 4.0)])
+
+    def test_contains_by_coordinates(self):
+        point_list = Point2DList(a_items=[Point2D(1, 2)])
+        self.assertIn(Point2D(1, 2), point_list)
+        self.assertNotIn(Point2D(9, 9), point_list)
+
+
+class TestSpeedsBatch(unittest.TestCase):
+    """The batched speed kernel and its fallbacks."""
+
+    def _pairs(self):
+        rng = np.random.default_rng(7)
+        src = rng.uniform(-100, 100, size=(32, 2)).astype(np.float32)
+        dst = rng.uniform(-100, 100, size=(32, 2)).astype(np.float32)
+        return src, dst
+
+    def test_kernel_matches_per_point_speed(self):
+        src, dst = self._pairs()
+        out = speeds_batch(src, dst)
+        for i in range(src.shape[0]):
+            dy, dx = Point2D(float(src[i, 0]), float(src[i, 1])).speed(
+                Point2D(float(dst[i, 0]), float(dst[i, 1]))
+            )
+            self.assertAlmostEqual(float(out[i, 0]), dy, places=5)
+            self.assertAlmostEqual(float(out[i, 1]), dx, places=5)
+
+    def test_loop_and_numpy_variants_agree(self):
+        src, dst = self._pairs()
+        np.testing.assert_allclose(
+            _speeds_batch_py(src, dst), _speeds_batch_np(src, dst), atol=1e-6
+        )
+
+    def test_speeds_to_validates_length(self):
+        src = Point2DList(a_items=[Point2D(0, 0)])
+        dst = Point2DList(a_items=[Point2D(1, 1), Point2D(2, 2)])
+        with self.assertRaises(ValueError):
+            src.speeds_to(dst)
+
+    def test_speeds_to_shape_and_normalization(self):
+        src = Point2DList(a_items=[Point2D(0, 0), Point2D(1, 1)])
+        dst = Point2DList(a_items=[Point2D(3, 4), Point2D(1, 2)])
+        out = src.speeds_to(dst)
+        self.assertEqual(out.shape, (2, 2))
+        np.testing.assert_allclose(np.hypot(out[:, 0], out[:, 1]), [1.0, 1.0], atol=1e-5)
+
+
+class TestKeyPoint2D(unittest.TestCase):
+    """Behavior of :class:`KeyPoint2D`."""
+
+    def test_score_is_optional(self):
+        self.assertIsNone(KeyPoint2D(1, 2).score)
+        self.assertEqual(KeyPoint2D(1, 2, a_score=0.5).score, 0.5)
+        with self.assertRaises(TypeError):
+            KeyPoint2D(1, 2, a_score="high")
+
+    def test_from_xy_with_and_without_score(self):
+        scored = KeyPoint2D.from_xy([1, 2, 0.9])
+        self.assertAlmostEqual(scored.score, 0.9, places=6)
+        unscored = KeyPoint2D.from_xy(np.asarray([1.0, 2.0], dtype=np.float32))
+        self.assertIsNone(unscored.score)
+        with self.assertRaises(ValueError):
+            KeyPoint2D.from_xy([1, 2, 3, 4])
+
+    def test_to_numpy_shape_follows_score(self):
+        self.assertEqual(KeyPoint2D(1, 2).to_numpy().shape, (2,))
+        self.assertEqual(KeyPoint2D(1, 2, a_score=0.5).to_numpy().shape, (3,))
+
+
+class TestKeyPoint2DListRoundTrip(unittest.TestCase):
+    """NaN-score round-tripping of :class:`KeyPoint2DList`."""
+
+    def test_from_xy_without_scores(self):
+        keypoints = KeyPoint2DList.from_xy(np.asarray([[1, 2], [3, 4]], dtype=np.float32))
+        self.assertEqual(len(keypoints), 2)
+        self.assertIsNone(keypoints[0].score)
+        out = keypoints.to_xy()
+        self.assertEqual(out.shape, (2, 2))
+        np.testing.assert_array_equal(out, [[1, 2], [3, 4]])
+
+    def test_from_xy_with_scores(self):
+        rows = np.asarray([[1, 2, 0.9], [3, 4, 0.1]], dtype=np.float32)
+        keypoints = KeyPoint2DList.from_xy(rows)
+        self.assertAlmostEqual(keypoints[1].score, 0.1, places=6)
+        out = keypoints.to_xy()
+        self.assertEqual(out.shape, (2, 3))
+        np.testing.assert_allclose(out, rows, atol=1e-6)
+
+    def test_mixed_scores_fall_back_to_xy_only(self):
+        keypoints = KeyPoint2DList(
+            a_items=[KeyPoint2D(1, 2, a_score=0.9), KeyPoint2D(3, 4)]
+        )
+        self.assertAlmostEqual(keypoints[0].score, 0.9, places=6)
+        self.assertIsNone(keypoints[1].score)
+        out = keypoints.to_xy()
+        self.assertEqual(out.shape, (2, 2))
+
+    def test_from_xy_validates_shape(self):
+        with self.assertRaises(ValueError):
+            KeyPoint2DList.from_xy(np.zeros((2, 4), dtype=np.float32))
+
+    def test_bounded_eviction_preserves_scores(self):
+        keypoints = KeyPoint2DList(a_max_size=2)
+        keypoints.append(np.asarray([[1, 1, 0.1], [2, 2, 0.2], [3, 3, 0.3]], dtype=np.float32))
+        self.assertEqual(len(keypoints), 2)
+        self.assertAlmostEqual(keypoints[0].score, 0.2, places=6)
+        self.assertAlmostEqual(keypoints[1].score, 0.3, places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()